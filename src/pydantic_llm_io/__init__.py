@@ -2,9 +2,10 @@
 
 __version__ = "1.0.1"
 
-from .api import call_llm_validated, call_llm_validated_async
+from .api import call_llm_validated, call_llm_validated_async, gather_validated
+from .cache import CacheBackend, InMemoryCache
 from .clients import ChatClient, FakeChatClient, OpenAIChatClient
-from .config import LLMCallConfig, LoggingConfig, RetryConfig
+from .config import LLMCacheConfig, LLMCallConfig, LoggingConfig, RetryConfig
 from .exceptions import (
     ConfigError,
     LLMCallError,
@@ -18,12 +19,17 @@ __all__ = [
     # API
     "call_llm_validated",
     "call_llm_validated_async",
+    "gather_validated",
     # Clients
     "ChatClient",
     "OpenAIChatClient",
     "FakeChatClient",
+    # Cache
+    "CacheBackend",
+    "InMemoryCache",
     # Config
     "LLMCallConfig",
+    "LLMCacheConfig",
     "LoggingConfig",
     "RetryConfig",
     # Exceptions
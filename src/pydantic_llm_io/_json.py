@@ -0,0 +1,85 @@
+"""JSON serialization helpers (orjson when installed, stdlib otherwise)."""
+
+import dataclasses
+import datetime
+import enum
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    _HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Convert the types orjson serializes natively for the stdlib encoder."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return str(obj)
+
+
+def _stdlib_dumps(obj: Any, indent: bool, sort_keys: bool) -> str:
+    """Serialize obj with the stdlib encoder, matching orjson's output."""
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        default=_default,
+    )
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    Both backends produce the same output for JSON types, datetimes (ISO 8601),
+    enums (their value), dataclasses and int/float/bool/None dict keys: compact
+    separators (or 2-space indentation), non-ASCII characters left unescaped, and
+    other types rendered with str(). Values orjson cannot encode, such as ints
+    beyond 64 bits, are serialized by the stdlib encoder instead.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        sort_keys: Sort dictionary keys
+
+    Returns:
+        JSON string
+    """
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. an int beyond 64 bits: the stdlib encoder handles it
+
+    return _stdlib_dumps(obj, indent, sort_keys)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If data is not valid JSON (json.JSONDecodeError or orjson.JSONDecodeError)
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
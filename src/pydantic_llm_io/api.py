@@ -1,21 +1,105 @@
 """Main API for type-safe LLM calls."""
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError as PydanticValidationError
 
+from . import _json
+from .cache import CacheBackend, make_cache_key
 from .clients.base import ChatClient
 from .config import LLMCallConfig, LoggingConfig
 from .exceptions import LLMCallError
 from .logging import setup_logger
-from .prompts import PromptBuilder
-from .types import PromptModelT, ResponseModelT
+from .prompts import get_system_prompt, render_user
+from .types import PromptInput, ResponseModelT
 from .validation import ValidationEngine
 
 
+def _resolve_cache(
+    client: ChatClient,
+    system: str,
+    user: str,
+    config: LLMCallConfig,
+) -> tuple[CacheBackend, str] | None:
+    """Return the cache backend and key for this request, or None if caching is off.
+
+    Args:
+        client: Chat client the request will be sent to
+        system: System prompt
+        user: User message
+        config: Call configuration
+
+    Returns:
+        Tuple of (backend, cache_key), or None
+    """
+    backend = config.cache.backend
+    if backend is None or not config.cache.is_enabled_for(config.temperature):
+        return None
+    key = make_cache_key(
+        provider=client.get_provider_name(),
+        model=getattr(client, "model", None),
+        system=system,
+        user=user,
+        temperature=config.temperature,
+    )
+    return backend, key
+
+
+def _read_cache(
+    backend: CacheBackend,
+    key: str,
+    response_model: type[ResponseModelT],
+    trust_cache: bool,
+    logger: logging.Logger,
+) -> ResponseModelT | None:
+    """Load a cached response.
+
+    Entries that no longer fit the response model are evicted.
+
+    Args:
+        backend: Cache backend
+        key: Cache key
+        response_model: Pydantic model for validation
+        trust_cache: Build the model with model_construct, skipping validation
+        logger: Logger instance
+
+    Returns:
+        Response model instance, or None on a miss
+    """
+    cached = backend.get(key)
+    if cached is None:
+        return None
+    try:
+        if trust_cache:
+            return response_model.model_construct(**_json.loads(cached))
+        return response_model.model_validate_json(cached)
+    except (PydanticValidationError, ValueError, TypeError):
+        logger.warning("Discarding invalid cached response for %s", response_model.__name__)
+        backend.delete(key)
+        return None
+
+
+def _cache_entry(result: BaseModel) -> str:
+    """Serialize a validated response so _read_cache can validate it back.
+
+    Fields are written by alias (the names validation expects) and computed
+    fields are left out, since models that forbid extra keys would reject them.
+
+    Args:
+        result: Validated response model instance
+
+    Returns:
+        JSON string to store in the cache backend
+    """
+    computed = set(type(result).model_computed_fields)
+    return result.model_dump_json(by_alias=True, exclude=computed or None)
+
+
 def call_llm_validated(
-    prompt_model: PromptModelT,
+    prompt_model: PromptInput,
     response_model: type[ResponseModelT],
     client: ChatClient,
     config: LLMCallConfig | None = None,
@@ -23,7 +107,7 @@ def call_llm_validated(
     """Call LLM with type-safe input/output validation.
 
     Args:
-        prompt_model: Pydantic model containing user prompt
+        prompt_model: Pydantic model, dataclass or mapping containing user prompt
         response_model: Pydantic model for response validation
         client: Chat client instance (OpenAI, Fake, etc.)
         config: Optional LLMCallConfig for retries, logging, custom system
@@ -40,13 +124,21 @@ def call_llm_validated(
     config = config or LLMCallConfig()
     logger = setup_logger("pydantic_llm_io.api", config.logging)
 
-    # Build prompt
-    prompt_builder = PromptBuilder(config.custom_system_prompt)
-    schema = response_model.model_json_schema()
-    system, user = prompt_builder.build(prompt_model, schema)
+    # Build prompt (the system prompt is rendered once per response model)
+    system = get_system_prompt(response_model, config.custom_system_prompt)
+    user = render_user(prompt_model)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("System prompt:\n%s...", system[:200])
+        logger.debug("User message:\n%s...", user[:200])
 
-    logger.debug(f"System prompt:\n{system[:200]}...")
-    logger.debug(f"User message:\n{user[:200]}...")
+    # Serve repeated deterministic requests from cache
+    cache_slot = _resolve_cache(client, system, user, config)
+    if cache_slot is not None:
+        cached = _read_cache(*cache_slot, response_model, config.cache.trust_cache, logger)
+        if cached is not None:
+            logger.info("Cache hit for %s", response_model.__name__)
+            return cached
 
     # Get response from LLM
     try:
@@ -55,13 +147,16 @@ def call_llm_validated(
             user=user,
             temperature=config.temperature,
         )
-        logger.debug(f"LLM response:\n{response_text[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LLM response:\n%s...", response_text[:200])
     except LLMCallError as e:
-        logger.error(f"LLM request failed: {e.message}", extra={"context": e.context})
+        logger.error("LLM request failed: %s", e.message, extra={"context": e.context})
         raise
 
     # Validate with retries
-    engine = ValidationEngine(config.retry, config.logging, logger)
+    engine = ValidationEngine(
+        config.retry, config.logging, logger, trust_responses=config.trust_responses
+    )
     try:
         result = engine.validate_with_retries(
             response_text=response_text,
@@ -70,15 +165,20 @@ def call_llm_validated(
             prompt_system=system,
             prompt_user=user,
         )
-        logger.info(f"Successfully validated response to {response_model.__name__}")
-        return result
+        logger.info("Successfully validated response to %s", response_model.__name__)
     except Exception as e:
-        logger.error(f"Validation failed: {str(e)}")
+        logger.error("Validation failed: %s", e)
         raise
 
+    # Unvalidated (trusted) responses never reach the cache
+    if cache_slot is not None and not config.trust_responses:
+        backend, key = cache_slot
+        backend.set(key, _cache_entry(result))
+    return result
+
 
 async def call_llm_validated_async(
-    prompt_model: PromptModelT,
+    prompt_model: PromptInput,
     response_model: type[ResponseModelT],
     client: ChatClient,
     config: LLMCallConfig | None = None,
@@ -86,7 +186,7 @@ async def call_llm_validated_async(
     """Call LLM with type-safe input/output validation (async).
 
     Args:
-        prompt_model: Pydantic model containing user prompt
+        prompt_model: Pydantic model, dataclass or mapping containing user prompt
         response_model: Pydantic model for response validation
         client: Chat client instance (OpenAI, Fake, etc.)
         config: Optional LLMCallConfig for retries, logging, custom system
@@ -103,13 +203,21 @@ async def call_llm_validated_async(
     config = config or LLMCallConfig()
     logger = setup_logger("pydantic_llm_io.api", config.logging)
 
-    # Build prompt
-    prompt_builder = PromptBuilder(config.custom_system_prompt)
-    schema = response_model.model_json_schema()
-    system, user = prompt_builder.build(prompt_model, schema)
+    # Build prompt (the system prompt is rendered once per response model)
+    system = get_system_prompt(response_model, config.custom_system_prompt)
+    user = render_user(prompt_model)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("System prompt:\n%s...", system[:200])
+        logger.debug("User message:\n%s...", user[:200])
 
-    logger.debug(f"System prompt:\n{system[:200]}...")
-    logger.debug(f"User message:\n{user[:200]}...")
+    # Serve repeated deterministic requests from cache
+    cache_slot = _resolve_cache(client, system, user, config)
+    if cache_slot is not None:
+        cached = _read_cache(*cache_slot, response_model, config.cache.trust_cache, logger)
+        if cached is not None:
+            logger.info("Cache hit for %s", response_model.__name__)
+            return cached
 
     # Get response from LLM (async)
     try:
@@ -118,13 +226,16 @@ async def call_llm_validated_async(
             user=user,
             temperature=config.temperature,
         )
-        logger.debug(f"LLM response:\n{response_text[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LLM response:\n%s...", response_text[:200])
     except LLMCallError as e:
-        logger.error(f"LLM request failed: {e.message}", extra={"context": e.context})
+        logger.error("LLM request failed: %s", e.message, extra={"context": e.context})
         raise
 
     # Validate with retries (async)
-    engine = ValidationEngine(config.retry, config.logging, logger)
+    engine = ValidationEngine(
+        config.retry, config.logging, logger, trust_responses=config.trust_responses
+    )
     try:
         result = await engine.validate_with_retries_async(
             response_text=response_text,
@@ -133,8 +244,68 @@ async def call_llm_validated_async(
             prompt_system=system,
             prompt_user=user,
         )
-        logger.info(f"Successfully validated response to {response_model.__name__}")
-        return result
+        logger.info("Successfully validated response to %s", response_model.__name__)
     except Exception as e:
-        logger.error(f"Validation failed: {str(e)}")
+        logger.error("Validation failed: %s", e)
+        raise
+
+    # Unvalidated (trusted) responses never reach the cache
+    if cache_slot is not None and not config.trust_responses:
+        backend, key = cache_slot
+        backend.set(key, _cache_entry(result))
+    return result
+
+
+async def gather_validated(
+    requests: Iterable[tuple[PromptInput, type[BaseModel], ChatClient]],
+    config: LLMCallConfig | None = None,
+    *,
+    concurrency: int = 8,
+) -> list[BaseModel]:
+    """Run many validated LLM calls concurrently with bounded concurrency.
+
+    At most `concurrency` requests are in flight at once. Identical requests
+    (same client, prompt and response model) within the batch are sent only
+    once and share the result.
+
+    Args:
+        requests: Iterable of (prompt_model, response_model, client) tuples
+        config: Optional LLMCallConfig applied to every call
+        concurrency: Maximum number of simultaneous LLM calls
+
+    Returns:
+        Validated response model instances, in the order of `requests`
+
+    Raises:
+        ValueError: If concurrency < 1
+        LLMIOError: The first error raised by any call
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(
+        prompt_model: PromptInput,
+        response_model: type[BaseModel],
+        client: ChatClient,
+    ) -> BaseModel:
+        async with semaphore:
+            return await call_llm_validated_async(prompt_model, response_model, client, config)
+
+    tasks: dict[tuple[Any, ...], asyncio.Task[BaseModel]] = {}
+    ordered: list[asyncio.Task[BaseModel]] = []
+    for prompt_model, response_model, client in requests:
+        key = (id(client), render_user(prompt_model), response_model)
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run(prompt_model, response_model, client))
+            tasks[key] = task
+        ordered.append(task)
+
+    try:
+        return list(await asyncio.gather(*ordered))
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
         raise
@@ -0,0 +1,107 @@
+"""Response caching for repeated LLM calls."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Protocol, runtime_checkable
+
+from . import _json
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses.
+
+    Keys are hex digests produced by `make_cache_key`; values are validated
+    response payloads serialized as JSON strings.
+    """
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent."""
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        ...
+
+
+class InMemoryCache:
+    """Thread-safe in-process LRU cache backend."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently used is evicted
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+
+def make_cache_key(
+    provider: str,
+    model: str | None,
+    system: str,
+    user: str,
+    temperature: float,
+) -> str:
+    """Build a stable cache key for an LLM request.
+
+    Args:
+        provider: Provider name (from ChatClient.get_provider_name)
+        model: Model name, if the client exposes one
+        system: System prompt
+        user: User message
+        temperature: Sampling temperature
+
+    Returns:
+        SHA-256 hex digest of the request parameters
+    """
+    payload = _json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "system": system,
+            "user": user,
+            "temperature": temperature,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
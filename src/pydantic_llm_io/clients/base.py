@@ -53,6 +53,50 @@ class ChatClient(ABC):
         """
         pass
 
+    def send_messages(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+    ) -> str:
+        """構築済みのメッセージリストを送信してレスポンスを取得する.
+
+        リトライ時にシステムメッセージを再構築せずに使い回すための入口。
+        デフォルト実装は role ごとに内容を結合して send_message に委譲する。
+        プロバイダーがメッセージリストをそのまま受け付ける場合はオーバーライドする。
+
+        Args:
+            messages: {"role": ..., "content": ...} 形式のメッセージリスト
+            temperature: サンプリング温度 (0.0-2.0)
+
+        Returns:
+            LLM からのレスポンステキスト
+
+        Raises:
+            LLMCallError: リクエスト失敗時
+        """
+        system, user = _split_messages(messages)
+        return self.send_message(system=system, user=user, temperature=temperature)
+
+    async def send_messages_async(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+    ) -> str:
+        """非同期版: 構築済みのメッセージリストを送信してレスポンスを取得する.
+
+        Args:
+            messages: {"role": ..., "content": ...} 形式のメッセージリスト
+            temperature: サンプリング温度 (0.0-2.0)
+
+        Returns:
+            LLM からのレスポンステキスト
+
+        Raises:
+            LLMCallError: リクエスト失敗時
+        """
+        system, user = _split_messages(messages)
+        return await self.send_message_async(system=system, user=user, temperature=temperature)
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """プロバイダー名を返す.
@@ -61,3 +105,17 @@ class ChatClient(ABC):
             プロバイダー名 ('openai', 'anthropic' など)
         """
         pass
+
+
+def _split_messages(messages: list[dict[str, str]]) -> tuple[str, str]:
+    """メッセージリストをシステムプロンプトとユーザーメッセージに分割する.
+
+    Args:
+        messages: {"role": ..., "content": ...} 形式のメッセージリスト
+
+    Returns:
+        (system, user) のタプル
+    """
+    system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+    user = "\n\n".join(m["content"] for m in messages if m["role"] != "system")
+    return system, user
@@ -1,22 +1,38 @@
 """Fake chat client for testing."""
 
+from array import array
+
 from .base import ChatClient
 
 
 class FakeChatClient(ChatClient):
     """Testing double that returns predefined responses."""
 
-    def __init__(self, response_text: str) -> None:
+    def __init__(self, response_text: str, record: bool = True) -> None:
         """Initialize fake client.
 
         Args:
             response_text: Fixed response to return
+            record: Record last_system/last_user/call_history for each call.
+                Disable for benchmarks and load tests; call_count is always kept.
         """
         self.response_text = response_text
+        self.record = record
         self.call_count = 0
         self.last_system: str | None = None
         self.last_user: str | None = None
-        self.call_history: list[dict[str, str]] = []
+        # Call history stored column-wise; dicts are only built when call_history is read
+        self._systems: list[str] = []
+        self._users: list[str] = []
+        self._temperatures = array("d")
+
+    @property
+    def call_history(self) -> list[dict[str, str]]:
+        """Recorded calls as a list of {"system", "user", "temperature"} dicts."""
+        return [
+            {"system": system, "user": user, "temperature": str(temperature)}
+            for system, user, temperature in zip(self._systems, self._users, self._temperatures)
+        ]
 
     def send_message(
         self,
@@ -35,13 +51,12 @@ class FakeChatClient(ChatClient):
             Predefined response text
         """
         self.call_count += 1
-        self.last_system = system
-        self.last_user = user
-        self.call_history.append({
-            "system": system,
-            "user": user,
-            "temperature": str(temperature),
-        })
+        if self.record:
+            self.last_system = system
+            self.last_user = user
+            self._systems.append(system)
+            self._users.append(user)
+            self._temperatures.append(temperature)
         return self.response_text
 
     async def send_message_async(
@@ -75,4 +90,6 @@ class FakeChatClient(ChatClient):
         self.call_count = 0
         self.last_system = None
         self.last_user = None
-        self.call_history.clear()
+        self._systems.clear()
+        self._users.clear()
+        del self._temperatures[:]
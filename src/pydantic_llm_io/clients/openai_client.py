@@ -1,24 +1,70 @@
 """OpenAI API client implementation."""
 
+import threading
+from typing import cast
+
+import httpx
 from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletionMessageParam
 
 from ..exceptions import LLMCallError
 from .base import ChatClient
 
+# Connection pool shared by every OpenAIChatClient that is not given its own http_client
+_SHARED_HTTP_CLIENT: httpx.Client | None = None
+_SHARED_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide pooled httpx client, creating it on first use.
+
+    Returns:
+        Shared httpx.Client with keep-alive connection pooling
+    """
+    global _SHARED_HTTP_CLIENT
+    with _SHARED_HTTP_CLIENT_LOCK:
+        if _SHARED_HTTP_CLIENT is None or _SHARED_HTTP_CLIENT.is_closed:
+            _SHARED_HTTP_CLIENT = httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                follow_redirects=True,
+            )
+        return _SHARED_HTTP_CLIENT
+
 
 class OpenAIChatClient(ChatClient):
-    """OpenAI API implementation of ChatClient."""
+    """OpenAI API implementation of ChatClient.
+
+    Sync requests from all instances share one pooled httpx client, so creating
+    many clients (e.g. one per web request) reuses keep-alive connections instead
+    of paying a new TCP/TLS handshake each time. Async connections are bound to
+    the event loop that opened them, so each instance gets its own async pool
+    unless a shared ``async_http_client`` is passed in.
+    """
 
-    def __init__(self, api_key: str, model: str = "gpt-4o") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
+        stream: bool = False,
+    ) -> None:
         """Initialize OpenAI client.
 
         Args:
             api_key: OpenAI API key
             model: Model name (default: gpt-4o)
+            http_client: httpx client for sync requests (default: shared pool)
+            async_http_client: httpx client for async requests (default: per-instance)
+            stream: Stream completions and assemble the content as chunks arrive
         """
-        self.client = OpenAI(api_key=api_key)
-        self.async_client = AsyncOpenAI(api_key=api_key)
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=http_client or _get_shared_http_client(),
+        )
+        self.async_client = AsyncOpenAI(api_key=api_key, http_client=async_http_client)
         self.model = model
+        self.stream = stream
 
     def send_message(
         self,
@@ -39,16 +85,54 @@ class OpenAIChatClient(ChatClient):
         Raises:
             LLMCallError: If API request fails
         """
+        return self.send_messages(
+            [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=temperature,
+        )
+
+    def send_messages(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+    ) -> str:
+        """Send a prebuilt message list to OpenAI API.
+
+        Args:
+            messages: Chat messages as {"role": ..., "content": ...} dicts
+            temperature: Sampling temperature
+
+        Returns:
+            Response text
+
+        Raises:
+            LLMCallError: If API request fails
+        """
+        chat_messages = cast(list[ChatCompletionMessageParam], messages)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
-                temperature=temperature,
-            )
-            content = response.choices[0].message.content
+            content: str | None
+            if self.stream:
+                chunks = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=chat_messages,
+                    temperature=temperature,
+                    stream=True,
+                )
+                parts = [
+                    chunk.choices[0].delta.content
+                    for chunk in chunks
+                    if chunk.choices and chunk.choices[0].delta.content
+                ]
+                content = "".join(parts) if parts else None
+            else:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=chat_messages,
+                    temperature=temperature,
+                )
+                content = response.choices[0].message.content
             if content is None:
                 raise LLMCallError(
                     message="OpenAI returned empty response content",
@@ -84,16 +168,54 @@ class OpenAIChatClient(ChatClient):
         Raises:
             LLMCallError: If API request fails
         """
+        return await self.send_messages_async(
+            [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=temperature,
+        )
+
+    async def send_messages_async(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+    ) -> str:
+        """Send a prebuilt message list to OpenAI API (async).
+
+        Args:
+            messages: Chat messages as {"role": ..., "content": ...} dicts
+            temperature: Sampling temperature
+
+        Returns:
+            Response text
+
+        Raises:
+            LLMCallError: If API request fails
+        """
+        chat_messages = cast(list[ChatCompletionMessageParam], messages)
         try:
-            response = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
-                temperature=temperature,
-            )
-            content = response.choices[0].message.content
+            content: str | None
+            if self.stream:
+                chunks = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=chat_messages,
+                    temperature=temperature,
+                    stream=True,
+                )
+                parts = [
+                    chunk.choices[0].delta.content
+                    async for chunk in chunks
+                    if chunk.choices and chunk.choices[0].delta.content
+                ]
+                content = "".join(parts) if parts else None
+            else:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=chat_messages,
+                    temperature=temperature,
+                )
+                content = response.choices[0].message.content
             if content is None:
                 raise LLMCallError(
                     message="OpenAI returned empty response content",
@@ -3,10 +3,15 @@
 import logging
 from dataclasses import dataclass, field
 
+from .cache import CacheBackend
+
 
 @dataclass(frozen=True)
 class RetryConfig:
-    """Retry configuration."""
+    """Retry configuration.
+
+    Set initial_delay_seconds=0 to retry immediately without backoff.
+    """
 
     max_retries: int = 3
     initial_delay_seconds: float = 1.0
@@ -21,6 +26,23 @@ class RetryConfig:
         if self.backoff_multiplier <= 1:
             raise ValueError("backoff_multiplier must be > 1")
 
+        # Precomputed backoff schedule. A plain attribute rather than a dataclass field,
+        # so it stays out of fields(), asdict(), replace(), eq and repr
+        object.__setattr__(
+            self,
+            "_delays",
+            tuple(
+                self.initial_delay_seconds * (self.backoff_multiplier**attempt)
+                for attempt in range(self.max_retries + 1)
+            ),
+        )
+
+    @property
+    def delays(self) -> tuple[float, ...]:
+        """Backoff delay in seconds for each attempt (index = 0-indexed attempt)."""
+        delays: tuple[float, ...] = self._delays  # type: ignore[attr-defined]
+        return delays
+
     def get_delay(self, attempt: int) -> float:
         """Get delay for a given attempt number.
 
@@ -30,6 +52,9 @@ class RetryConfig:
         Returns:
             Delay in seconds
         """
+        delays: tuple[float, ...] = self._delays  # type: ignore[attr-defined]
+        if 0 <= attempt < len(delays):
+            return delays[attempt]
         return self.initial_delay_seconds * (self.backoff_multiplier ** attempt)
 
 
@@ -52,14 +77,37 @@ class LoggingConfig:
         return getattr(logging, self.level.upper())
 
 
+@dataclass(frozen=True)
+class LLMCacheConfig:
+    """Response cache configuration."""
+
+    backend: CacheBackend | None = None  # None disables caching
+    deterministic_only: bool = True  # Only cache calls made with temperature == 0
+    # Rebuild hits with model_construct instead of re-validating. Entries are written
+    # only after validation, but field validators are skipped and nested models are
+    # left as plain dicts, so enable this only for flat response models.
+    trust_cache: bool = False
+
+    def is_enabled_for(self, temperature: float) -> bool:
+        """Return whether responses at the given temperature should be cached."""
+        if self.backend is None:
+            return False
+        return not self.deterministic_only or temperature == 0
+
+
 @dataclass(frozen=True)
 class LLMCallConfig:
     """LLM call configuration."""
 
     retry: RetryConfig = field(default_factory=RetryConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
+    cache: LLMCacheConfig = field(default_factory=LLMCacheConfig)
     custom_system_prompt: str | None = None
     temperature: float = 0.7
+    # Build responses with model_construct instead of validating them. Only for trusted
+    # sources (e.g. canned responses in tests): nothing is checked, field validators are
+    # skipped and nested models are left as plain dicts. Such responses are not cached.
+    trust_responses: bool = False
 
     def __post_init__(self) -> None:
         """Validation."""
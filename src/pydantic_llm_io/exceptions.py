@@ -1,11 +1,23 @@
 """Exception class definitions and error handling."""
 
-import json
 import logging
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Length limit for the raw response kept in error context
+MAX_RAW_RESPONSE_CHARS = 1000
+
+
+def _restore_error(cls: type["LLMIOError"], args: tuple[Any, ...]) -> "LLMIOError":
+    """Rebuild a pickled error without re-running its constructor (or its logging).
+
+    The instance __dict__ (message, context, notes, ...) is restored by pickle afterwards.
+    """
+    error = cls.__new__(cls, *args)
+    error.args = args
+    return error
+
 
 class LLMIOError(Exception):
     """Base exception for all pydantic-llm-io errors."""
@@ -23,19 +35,36 @@ class LLMIOError(Exception):
         """
         self.message = message
         self.context = context or {}
+        self._dict_cache: dict[str, Any] | None = None
         super().__init__(message)
 
     def __str__(self) -> str:
         """String representation."""
         return self.message
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle support: subclass constructors do not take self.args positionally."""
+        state = {**self.__dict__, "_dict_cache": None}
+        return (_restore_error, (type(self), self.args), state)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary format."""
-        return {
-            "error": self.__class__.__name__,
-            "message": self.message,
-            "context": self.context,
-        }
+        """Convert to dictionary format.
+
+        The result is built once and reused (it is shared, do not mutate it); it is
+        rebuilt only if message or context is reassigned.
+        """
+        cached = self._dict_cache
+        if (
+            cached is None
+            or cached["message"] is not self.message
+            or cached["context"] is not self.context
+        ):
+            cached = self._dict_cache = {
+                "error": self.__class__.__name__,
+                "message": self.message,
+                "context": self.context,
+            }
+        return cached
 
 
 class LLMCallError(LLMIOError):
@@ -62,10 +91,11 @@ class LLMCallError(LLMIOError):
             "attempt": attempt,
         }
         super().__init__(message, context)
-        logger.error(
-            f"LLM call failed on provider '{provider}' (attempt {attempt + 1}): {message}",
-            exc_info=raw_error,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"LLM call failed on provider '{provider}' (attempt {attempt + 1}): {message}",
+                exc_info=raw_error,
+            )
 
 
 class LLMParseError(LLMIOError):
@@ -87,15 +117,16 @@ class LLMParseError(LLMIOError):
             attempt: Retry attempt number
         """
         context: dict[str, Any] = {
-            "raw_response": raw_response[:1000],  # Length limit
+            "raw_response": raw_response[:MAX_RAW_RESPONSE_CHARS],
             "parse_error": str(parse_error),
             "attempt": attempt,
         }
         super().__init__(message, context)
-        logger.warning(
-            f"JSON parsing failed (attempt {attempt + 1}): {message}",
-            extra={"raw_response_preview": raw_response[:200]},
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"JSON parsing failed (attempt {attempt + 1}): {message}",
+                extra={"raw_response_preview": raw_response[:200]},
+            )
 
 
 class LLMValidationError(LLMIOError):
@@ -117,16 +148,17 @@ class LLMValidationError(LLMIOError):
             attempt: Retry attempt number
         """
         context: dict[str, Any] = {
-            "raw_response": raw_response[:1000],  # Length limit
+            "raw_response": raw_response[:MAX_RAW_RESPONSE_CHARS],
             "validation_errors": validation_errors,
             "attempt": attempt,
         }
         super().__init__(message, context)
-        error_count = len(validation_errors)
-        logger.warning(
-            f"Pydantic validation failed (attempt {attempt + 1}): {error_count} error(s)",
-            extra={"errors": validation_errors[:3]},  # First 3 errors only
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            error_count = len(validation_errors)
+            logger.warning(
+                f"Pydantic validation failed (attempt {attempt + 1}): {error_count} error(s)",
+                extra={"errors": validation_errors[:3]},  # First 3 errors only
+            )
 
 
 class RetryExhaustedError(LLMIOError):
@@ -150,9 +182,10 @@ class RetryExhaustedError(LLMIOError):
             "attempts": attempts,
         }
         super().__init__(message, context)
-        logger.error(
-            f"Retry exhausted after {attempts} attempts. Last error: {last_error.message}"
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"Retry exhausted after {attempts} attempts. Last error: {last_error.message}"
+            )
 
 
 class ConfigError(LLMIOError):
@@ -165,7 +198,5 @@ class ConfigError(LLMIOError):
             message: Error message
             config_key: Configuration key that caused the issue
         """
-        context: dict[str, Any] = {}
-        if config_key:
-            context["config_key"] = config_key
+        context: dict[str, Any] = {"config_key": config_key} if config_key else {}
         super().__init__(message, context)
@@ -2,9 +2,14 @@
 
 import logging
 import sys
+import threading
 
 from .config import LoggingConfig
 
+# Console handler installed by setup_logger, per logger name
+_HANDLERS: dict[str, logging.Handler] = {}
+_HANDLERS_LOCK = threading.Lock()
+
 
 def setup_logger(
     name: str,
@@ -12,6 +17,9 @@ def setup_logger(
 ) -> logging.Logger:
     """Set up a custom logger.
 
+    The console handler is created only once per logger name; later calls just
+    update the level, so this is cheap to call on every request.
+
     Args:
         name: Logger name
         config: Logging configuration
@@ -20,21 +28,30 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(config.get_logging_level())
-
-    # Clear existing handlers to prevent duplicates
-    logger.handlers.clear()
-
-    # Formatter configuration
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    # Handler configuration (console output)
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    level = config.get_logging_level()
+    if logger.level != level:
+        # setLevel clears the logging module's level cache, so skip it when unchanged
+        logger.setLevel(level)
+
+    handler = _HANDLERS.get(name)
+    if handler is not None and logger.handlers == [handler]:
+        return logger
+
+    with _HANDLERS_LOCK:
+        # Clear existing handlers to prevent duplicates
+        logger.handlers.clear()
+
+        # Formatter configuration
+        formatter = logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+        # Handler configuration (console output)
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        _HANDLERS[name] = handler
 
     return logger
 
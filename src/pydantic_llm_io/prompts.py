@@ -1,46 +1,209 @@
 """Prompt construction and management."""
 
-import json
-from typing import Any
+import functools
+from collections.abc import Callable, Mapping
+from dataclasses import is_dataclass
+from typing import Any, Final
 
+import pydantic_core
 from pydantic import BaseModel
 
-from .types import PromptModelT, ResponseModelT
+from . import _json
+from .types import PromptInput
 
 
-DEFAULT_SYSTEM_PROMPT = """You are a helpful assistant that responds with valid JSON only.
+DEFAULT_SYSTEM_PROMPT: Final = """You are a helpful assistant that responds with valid JSON only.
 Respond ONLY with valid JSON matching the specified schema. No markdown, no code blocks, no explanations."""
 
+_SYSTEM_PROMPT_TEMPLATE: Final = """{system_prompt}
+
+Expected JSON schema:
+```json
+{schema_json}
+```"""
+
+# Class attributes holding the JSON schema, its compact serialization and the rendered
+# system prompts (keyed by custom system prompt) of a response model. Stored on the
+# class itself so lookups are a plain attribute read and the cache lives exactly as
+# long as the class.
+_SCHEMA_ATTR = "__pydantic_llm_io_schema__"
+_SCHEMA_JSON_ATTR = "__pydantic_llm_io_schema_json__"
+_SYSTEM_PROMPTS_ATTR = "__pydantic_llm_io_system_prompts__"
+# Bound on distinct custom prompts remembered per model (guards against per-request prompts)
+_MAX_SYSTEM_PROMPTS_PER_MODEL = 32
+
+
+def _class_cache(response_model: type[BaseModel], attr: str, value: Any) -> Any:
+    """Return the value cached on response_model under attr, storing value if absent.
+
+    Only the class's own __dict__ is consulted so a subclass never picks up its
+    parent's schema. Classes that refuse attribute assignment are not cached.
+    """
+    cached = response_model.__dict__.get(attr)
+    if cached is not None:
+        return cached
+    try:
+        setattr(response_model, attr, value)
+    except (AttributeError, TypeError):
+        pass
+    return value
+
+
+def get_response_schema(response_model: type[BaseModel]) -> dict[str, Any]:
+    """Return the JSON schema for a response model, computing it once per class.
+
+    Args:
+        response_model: Pydantic model class
+
+    Returns:
+        JSON schema dictionary (shared, must not be mutated)
+    """
+    schema: dict[str, Any] | None = response_model.__dict__.get(_SCHEMA_ATTR)
+    if schema is None:
+        schema = _class_cache(response_model, _SCHEMA_ATTR, response_model.model_json_schema())
+    return schema
+
+
+def _get_schema_json(response_model: type[BaseModel]) -> str:
+    """Return the compact JSON serialization of a response model's schema, once per class."""
+    schema_json: str | None = response_model.__dict__.get(_SCHEMA_JSON_ATTR)
+    if schema_json is None:
+        schema_json = _class_cache(
+            response_model, _SCHEMA_JSON_ATTR, _json.dumps(get_response_schema(response_model))
+        )
+    return schema_json
+
+
+def get_system_prompt(
+    response_model: type[BaseModel],
+    custom_system_prompt: str | None = None,
+) -> str:
+    """Return the system prompt with the response schema embedded.
+
+    The prompt only depends on the response model and the custom system prompt,
+    so it is rendered once and reused. Keeping this static text as the message
+    prefix also lets providers apply their own prompt caching.
+
+    Args:
+        response_model: Pydantic model class for the expected response
+        custom_system_prompt: Custom system prompt to override default
+
+    Returns:
+        System prompt string
+    """
+    prompts: dict[str | None, str] | None = response_model.__dict__.get(_SYSTEM_PROMPTS_ATTR)
+    if prompts is None:
+        prompts = _class_cache(response_model, _SYSTEM_PROMPTS_ATTR, {})
+
+    system = prompts.get(custom_system_prompt)
+    if system is None:
+        builder = PromptBuilder(custom_system_prompt)
+        system = builder._render_system(_get_schema_json(response_model))
+        if len(prompts) >= _MAX_SYSTEM_PROMPTS_PER_MODEL:
+            prompts.clear()
+        prompts[custom_system_prompt] = system
+    return system
+
+
+def render_user(prompt_model: PromptInput) -> str:
+    """Serialize a prompt input to the compact JSON user message.
+
+    Pydantic models are dumped with model_dump_json; dataclasses and mappings
+    (including TypedDicts) are serialized by pydantic-core directly, skipping
+    model validation, so equivalent inputs render identically.
+
+    Args:
+        prompt_model: Pydantic model, dataclass instance or mapping
+
+    Returns:
+        User message string
+
+    Raises:
+        TypeError: If prompt_model is none of the supported types
+    """
+    if isinstance(prompt_model, BaseModel):
+        return prompt_model.model_dump_json()
+    if is_dataclass(prompt_model) and not isinstance(prompt_model, type):
+        return pydantic_core.to_json(prompt_model).decode("utf-8")
+    if isinstance(prompt_model, Mapping):
+        return pydantic_core.to_json(dict(prompt_model)).decode("utf-8")
+    raise TypeError(
+        "prompt_model must be a Pydantic model, dataclass instance or mapping, "
+        f"got {type(prompt_model).__name__}"
+    )
+
 
 class PromptBuilder:
     """Constructs system and user messages from Pydantic models."""
 
-    def __init__(self, custom_system_prompt: str | None = None) -> None:
+    def __init__(
+        self,
+        custom_system_prompt: str | None = None,
+        pretty_schema: bool = False,
+    ) -> None:
         """Initialize the prompt builder.
 
         Args:
             custom_system_prompt: Custom system prompt to override default
+            pretty_schema: Indent the embedded schema (easier to read when debugging,
+                but more tokens sent to the LLM)
         """
+        self.custom_system_prompt = custom_system_prompt
+        self.pretty_schema = pretty_schema
         self.system_prompt = custom_system_prompt or DEFAULT_SYSTEM_PROMPT
 
     def build(
         self,
-        prompt_model: PromptModelT,
-        response_model_schema: dict[str, Any],
+        prompt_model: PromptInput,
+        response_model: type[BaseModel] | dict[str, Any],
     ) -> tuple[str, str]:
         """Build system and user messages.
 
+        Passing the response model class (rather than its schema) lets the
+        system prompt come from the per-class cache instead of being re-rendered.
+
         Args:
-            prompt_model: Pydantic model containing user prompt
-            response_model_schema: JSON schema for expected response
+            prompt_model: Pydantic model, dataclass or mapping containing user prompt
+            response_model: Pydantic model class for the expected response, or its JSON schema
 
         Returns:
             Tuple of (system_message, user_message)
         """
-        system = self._build_system(response_model_schema)
+        system = self._system_for(response_model)
         user = self._build_user(prompt_model)
         return system, user
 
+    def specialize(
+        self,
+        prompt_cls: type,
+        response_model: type[BaseModel],
+    ) -> "SpecializedPromptBuilder":
+        """Return a builder fixed to one prompt type and response model.
+
+        The returned builder renders the system prompt up front, so its build()
+        only serializes the prompt. Specializations are cached per
+        (prompt_cls, response_model, custom_system_prompt, pretty_schema).
+
+        Args:
+            prompt_cls: Pydantic model, dataclass or mapping type of the prompts
+            response_model: Pydantic model class for the expected response
+
+        Returns:
+            Shared SpecializedPromptBuilder instance
+        """
+        return _specialize(
+            prompt_cls, response_model, self.custom_system_prompt, self.pretty_schema
+        )
+
+    def _system_for(self, response_model: type[BaseModel] | dict[str, Any]) -> str:
+        """Return the system prompt for a response model class or JSON schema."""
+        if isinstance(response_model, dict):
+            return self._build_system(response_model)
+        if self.pretty_schema:
+            # The per-class cache holds compact prompts only
+            return self._build_system(get_response_schema(response_model))
+        return get_system_prompt(response_model, self.custom_system_prompt)
+
     def _build_system(self, schema: dict[str, Any]) -> str:
         """Build system prompt with schema.
 
@@ -50,21 +213,83 @@ class PromptBuilder:
         Returns:
             System prompt string
         """
-        schema_str = json.dumps(schema, indent=2)
-        return f"""{self.system_prompt}
+        return self._render_system(_json.dumps(schema, indent=self.pretty_schema))
 
-Expected JSON schema:
-```json
-{schema_str}
-```"""
+    def _render_system(self, schema_json: str) -> str:
+        """Embed an already serialized schema in the system prompt.
 
-    def _build_user(self, prompt_model: BaseModel) -> str:
+        Args:
+            schema_json: JSON schema serialized as a string
+
+        Returns:
+            System prompt string
+        """
+        return _SYSTEM_PROMPT_TEMPLATE.format(
+            system_prompt=self.system_prompt, schema_json=schema_json
+        )
+
+    def _build_user(self, prompt_model: PromptInput) -> str:
         """Build user message from prompt model.
 
         Args:
-            prompt_model: Pydantic model instance
+            prompt_model: Pydantic model, dataclass or mapping instance
 
         Returns:
             User message string
         """
-        return prompt_model.model_dump_json(indent=2)
+        return render_user(prompt_model)
+
+
+class SpecializedPromptBuilder:
+    """Prompt builder bound to one prompt type and response model.
+
+    Created by PromptBuilder.specialize. The system prompt is rendered once and
+    prompts of exactly prompt_cls are serialized directly by the class's
+    pydantic-core serializer; anything else (subclasses included) goes through
+    render_user.
+    """
+
+    __slots__ = ("prompt_cls", "response_model", "system", "_to_json")
+
+    def __init__(self, prompt_cls: type, response_model: type[BaseModel], system: str) -> None:
+        """Initialize the specialized builder.
+
+        Args:
+            prompt_cls: Type of the prompts passed to build()
+            response_model: Pydantic model class for the expected response
+            system: Rendered system prompt
+        """
+        self.prompt_cls = prompt_cls
+        self.response_model = response_model
+        self.system = system
+        self._to_json: Callable[[Any], bytes] | None = None
+        if issubclass(prompt_cls, BaseModel):
+            self._to_json = prompt_cls.__pydantic_serializer__.to_json
+
+    def build(self, prompt_model: PromptInput) -> tuple[str, str]:
+        """Build system and user messages.
+
+        Args:
+            prompt_model: Prompt input, normally an instance of prompt_cls
+
+        Returns:
+            Tuple of (system_message, user_message)
+        """
+        # The class serializer only knows prompt_cls's own fields: a subclass would
+        # lose its extra fields and an unrelated model would render as {}
+        to_json = self._to_json
+        if to_json is not None and type(prompt_model) is self.prompt_cls:
+            return self.system, to_json(prompt_model).decode("utf-8")
+        return self.system, render_user(prompt_model)
+
+
+@functools.lru_cache(maxsize=256)
+def _specialize(
+    prompt_cls: type,
+    response_model: type[BaseModel],
+    custom_system_prompt: str | None,
+    pretty_schema: bool,
+) -> SpecializedPromptBuilder:
+    """Build (once per argument tuple) the builder returned by PromptBuilder.specialize."""
+    builder = PromptBuilder(custom_system_prompt, pretty_schema)
+    return SpecializedPromptBuilder(prompt_cls, response_model, builder._system_for(response_model))
@@ -1,7 +1,8 @@
 """Type definitions and generic constraints."""
 
+from collections.abc import Mapping
 from enum import Enum
-from typing import TypeVar
+from typing import Any, ClassVar, Protocol, TypeAlias, TypeVar
 
 from pydantic import BaseModel
 
@@ -10,6 +11,16 @@ PromptModelT = TypeVar("PromptModelT", bound=BaseModel)
 ResponseModelT = TypeVar("ResponseModelT", bound=BaseModel)
 
 
+class DataclassInstance(Protocol):
+    """Structural type matching any dataclass instance."""
+
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+
+# Accepted prompt inputs: Pydantic models, dataclasses, or plain mappings (incl. TypedDict)
+PromptInput: TypeAlias = BaseModel | DataclassInstance | Mapping[str, Any]
+
+
 class MessageRole(str, Enum):
     """Message role definition."""
 
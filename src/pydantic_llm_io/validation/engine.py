@@ -1,22 +1,145 @@
 """Validation engine with retry logic."""
 
 import asyncio
-import json
+import functools
 import logging
 import time
-from typing import Any
+from collections.abc import Awaitable, Callable, Generator, Iterable, Sequence
+from typing import Any, cast
 
-from pydantic import BaseModel, ValidationError as PydanticValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
 
+from .. import _json
 from ..clients.base import ChatClient
 from ..config import LoggingConfig, RetryConfig
 from ..exceptions import (
+    MAX_RAW_RESPONSE_CHARS,
     LLMParseError,
     LLMValidationError,
     RetryExhaustedError,
 )
 from ..types import ResponseModelT
 
+_DEFAULT_LOGGER = logging.getLogger(__name__)
+
+_CORRECTION_PROMPT_TEMPLATE = """Your previous response was invalid (attempt {attempt}).
+
+Error details:
+{error_details}
+
+Your previous response:
+{raw_response}
+
+Please provide a corrected JSON response that strictly adheres to the schema."""
+
+
+@functools.lru_cache(maxsize=256)
+def _get_adapter(response_model: type[BaseModel]) -> TypeAdapter[Any]:
+    """Return a TypeAdapter for a response model, built once per class.
+
+    A bounded LRU is used rather than a WeakKeyDictionary: the adapter holds a
+    strong reference to its model class, so weak keys would never be released.
+
+    Args:
+        response_model: Pydantic model class
+
+    Returns:
+        Cached TypeAdapter wrapping the model's compiled validator
+    """
+    return TypeAdapter(response_model)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_list_adapter(response_model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return a TypeAdapter for a list of response models, built once per class."""
+    return TypeAdapter(list[response_model])  # type: ignore[valid-type]
+
+
+def _json_spans(raw_response: str | bytes) -> list[tuple[int, int]]:
+    """Locate candidate JSON objects and arrays in a response.
+
+    Handles the common cases of JSON wrapped in markdown fences or surrounded by
+    prose. One span is returned per bracket type, running from its first opening
+    bracket to its last closing bracket, so prose containing the other bracket
+    type (e.g. "see [1]" before an object) does not hide the JSON.
+
+    Args:
+        raw_response: Raw LLM response text or bytes
+
+    Returns:
+        (start, end) slice bounds ordered by start; empty if no bracketed span exists
+    """
+    if isinstance(raw_response, bytes):
+        starts = (raw_response.find(b"{"), raw_response.find(b"["))
+        ends = (raw_response.rfind(b"}"), raw_response.rfind(b"]"))
+    else:
+        starts = (raw_response.find("{"), raw_response.find("["))
+        ends = (raw_response.rfind("}"), raw_response.rfind("]"))
+    return sorted((start, end + 1) for start, end in zip(starts, ends) if -1 < start < end)
+
+
+def _as_str(raw_response: str | bytes) -> str:
+    """Decode a full raw response to str."""
+    if isinstance(raw_response, bytes):
+        return raw_response.decode("utf-8", errors="replace")
+    return raw_response
+
+
+def _as_text(raw_response: str | bytes) -> str:
+    """Return the bounded prefix of a raw response kept for error reporting.
+
+    Errors only store the first MAX_RAW_RESPONSE_CHARS characters, so only that
+    much is copied (and, for bytes, decoded) instead of the whole response.
+    """
+    if isinstance(raw_response, bytes):
+        # A UTF-8 character is at most 4 bytes
+        prefix = raw_response[: MAX_RAW_RESPONSE_CHARS * 4]
+        return prefix.decode("utf-8", errors="replace")[:MAX_RAW_RESPONSE_CHARS]
+    return raw_response[:MAX_RAW_RESPONSE_CHARS]
+
+
+def _is_malformed_json(errors: list[Any]) -> bool:
+    """Return True if pydantic rejected the response itself as invalid JSON.
+
+    pydantic-core reports malformed JSON as a single json_invalid error at the
+    root. The same error type at a field location comes from a Json[...] field
+    and is a validation failure.
+    """
+    return errors[0]["type"] == "json_invalid" and not errors[0]["loc"]
+
+
+def _to_error(
+    errors: list[Any],
+    raw_response: str | bytes,
+) -> LLMParseError | LLMValidationError:
+    """Convert pydantic error details into the matching pydantic-llm-io error.
+
+    Args:
+        errors: Pydantic error details (ValidationError.errors())
+        raw_response: Response that failed validation
+
+    Returns:
+        LLMParseError for malformed JSON, LLMValidationError otherwise
+    """
+    # Truncated once here; the error context, logs and correction prompt reuse it
+    response_text = _as_text(raw_response)
+
+    if _is_malformed_json(errors):
+        detail = errors[0].get("ctx", {}).get("error", errors[0]["msg"])
+        return LLMParseError(
+            message=f"JSON parsing failed: {detail}",
+            raw_response=response_text,
+            parse_error=ValueError(detail),
+            attempt=0,
+        )
+
+    return LLMValidationError(
+        message=f"Pydantic validation failed: {len(errors)} error(s)",
+        raw_response=response_text,
+        validation_errors=errors,
+        attempt=0,
+    )
+
 
 class ValidationEngine:
     """Handles JSON parsing and Pydantic validation with retries."""
@@ -25,28 +148,46 @@ class ValidationEngine:
         self,
         retry_config: RetryConfig,
         logging_config: LoggingConfig,
-        logger: logging.Logger,
+        logger: logging.Logger | None = None,
+        trust_responses: bool = False,
+        sleep: Callable[[float], None] | None = None,
+        async_sleep: Callable[[float], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize validation engine.
 
         Args:
             retry_config: Retry configuration
             logging_config: Logging configuration
-            logger: Logger instance
+            logger: Logger instance (default: this module's logger)
+            trust_responses: Build JSON object responses with model_construct, skipping validation
+            sleep: Backoff sleep for sync retries (default: time.sleep)
+            async_sleep: Backoff sleep for async retries (default: asyncio.sleep)
         """
         self.retry_config = retry_config
         self.logging_config = logging_config
-        self.logger = logger
+        self.logger = logger if logger is not None else _DEFAULT_LOGGER
+        self.trust_responses = trust_responses
+        self._sleep = sleep or time.sleep
+        self._async_sleep = async_sleep or asyncio.sleep
 
     def validate(
         self,
-        raw_response: str,
+        raw_response: str | bytes,
         response_model: type[ResponseModelT],
     ) -> ResponseModelT:
         """Validate response without retries.
 
+        JSON parsing and validation happen in a single pass inside pydantic-core,
+        so no intermediate Python dict is built. Bytes are accepted as-is, letting
+        clients that already hold the raw body skip decoding it. If the response is
+        not valid JSON as a whole, the outermost object and array spans (e.g. inside
+        a ```json fence) are tried before reporting a parse error.
+
+        With trust_responses enabled, a JSON object response is turned into the
+        model with model_construct and not validated at all.
+
         Args:
-            raw_response: Raw LLM response text
+            raw_response: Raw LLM response text (str or UTF-8 bytes)
             response_model: Pydantic model for validation
 
         Returns:
@@ -56,31 +197,123 @@ class ValidationEngine:
             LLMParseError: If JSON parsing fails
             LLMValidationError: If Pydantic validation fails
         """
-        # Parse JSON
+        if self.trust_responses:
+            try:
+                data = _json.loads(raw_response)
+            except ValueError:
+                pass  # Not JSON: report it through the regular path below
+            else:
+                if isinstance(data, dict):
+                    return response_model.model_construct(**data)
+
+        adapter: TypeAdapter[ResponseModelT] = _get_adapter(response_model)
         try:
-            data = json.loads(raw_response)
-        except json.JSONDecodeError as e:
-            raise LLMParseError(
-                message=f"JSON parsing failed: {str(e)}",
-                raw_response=raw_response,
-                parse_error=e,
-                attempt=0,
-            )
+            return adapter.validate_json(raw_response)
+        except PydanticValidationError as e:
+            # Built once and reused for the message and the context; per-error
+            # documentation URLs are dropped (noise in correction prompts)
+            errors = e.errors(include_url=False)
+
+        # Recover JSON wrapped in prose or code fences without a retry round-trip
+        if _is_malformed_json(errors):
+            schema_errors = None
+            for start, end in _json_spans(raw_response):
+                if (start, end) == (0, len(raw_response)):
+                    continue
+                try:
+                    return adapter.validate_json(raw_response[start:end])
+                except PydanticValidationError as e:
+                    span_errors = e.errors(include_url=False)
+                if schema_errors is None and not _is_malformed_json(span_errors):
+                    schema_errors = span_errors
+            # Extracted JSON parsed but failed the schema: report that instead
+            if schema_errors is not None:
+                errors = schema_errors
+
+        # Raised outside the except block: implicit chaining would keep the pydantic
+        # error alive on __context__, and it holds the full raw response as input.
+        raise _to_error(errors, raw_response)
+
+    def validate_many(
+        self,
+        raw_responses: Iterable[str | bytes],
+        response_model: type[ResponseModelT],
+    ) -> list[ResponseModelT | LLMParseError | LLMValidationError]:
+        """Validate a batch of responses against one response model, without retries.
+
+        Failures are returned in place instead of raised, so one bad response does
+        not abort the batch.
+
+        Args:
+            raw_responses: Raw LLM responses (str or UTF-8 bytes)
+            response_model: Pydantic model for validation
+
+        Returns:
+            One entry per response, in order: the validated model instance, or the
+            LLMParseError / LLMValidationError it failed with
+        """
+        validate = self.validate
+        results: list[ResponseModelT | LLMParseError | LLMValidationError] = []
+        append = results.append
+        for raw_response in raw_responses:
+            try:
+                append(validate(raw_response, response_model))
+            except (LLMParseError, LLMValidationError) as e:
+                append(e)
+        return results
+
+    def validate_batch(
+        self,
+        raw_responses: Sequence[str | bytes],
+        response_model: type[ResponseModelT],
+    ) -> list[ResponseModelT]:
+        """Validate a batch of responses in a single pydantic-core call, all or nothing.
+
+        The responses are joined into one JSON array and validated with a cached
+        list[response_model] adapter, so the whole batch costs one call into
+        pydantic-core. Unlike validate_many, any invalid response fails the batch,
+        and wrapped-JSON recovery and trust_responses do not apply; use it when the
+        responses are expected to be well-formed.
+
+        Args:
+            raw_responses: Raw LLM responses (str or UTF-8 bytes)
+            response_model: Pydantic model for validation
+
+        Returns:
+            Validated model instances, in input order
+
+        Raises:
+            LLMParseError: If the joined batch is not valid JSON, or a response does
+                not hold exactly one JSON value
+            LLMValidationError: If any response fails validation (error locations
+                start with the response's index)
+        """
+        if all(isinstance(raw, bytes) for raw in raw_responses):
+            payload: str | bytes = b"[" + b",".join(cast(Sequence[bytes], raw_responses)) + b"]"
+        else:
+            payload = "[" + ",".join(_as_str(raw) for raw in raw_responses) + "]"
 
-        # Validate Pydantic
         try:
-            return response_model.model_validate(data)
+            results = _get_list_adapter(response_model).validate_json(payload)
         except PydanticValidationError as e:
-            raise LLMValidationError(
-                message=f"Pydantic validation failed: {e.error_count()} error(s)",
-                raw_response=raw_response,
-                validation_errors=e.errors(),
+            errors = e.errors(include_url=False)
+        else:
+            # A response such as '{...},{...}' would otherwise split into extra items
+            if len(results) == len(raw_responses):
+                return cast(list[ResponseModelT], results)
+            error = ValueError(f"expected {len(raw_responses)} JSON values, got {len(results)}")
+            raise LLMParseError(
+                message=f"JSON parsing failed: {error}",
+                raw_response=_as_text(payload),
+                parse_error=error,
                 attempt=0,
             )
 
+        raise _to_error(errors, payload)
+
     def validate_with_retries(
         self,
-        response_text: str,
+        response_text: str | bytes,
         response_model: type[ResponseModelT],
         client: ChatClient,
         prompt_system: str,
@@ -89,7 +322,7 @@ class ValidationEngine:
         """Validate response with retries and LLM re-querying.
 
         Args:
-            response_text: Initial response text from LLM
+            response_text: Initial response text (or UTF-8 bytes) from LLM
             response_model: Pydantic model for validation
             client: Chat client for retry queries
             prompt_system: System prompt (for re-query)
@@ -103,44 +336,32 @@ class ValidationEngine:
             LLMValidationError: If validation consistently fails
             RetryExhaustedError: If all retries are exhausted
         """
-        last_error: Any = None
-
-        for attempt in range(self.retry_config.max_retries + 1):
-            try:
-                return self.validate(response_text, response_model)
-            except (LLMParseError, LLMValidationError) as e:
-                last_error = e
-                self._log_validation_failure(e, attempt)
+        if self.retry_config.max_retries == 0:
+            return self._validate_once(response_text, response_model)
 
-                # If retries remain, ask LLM to correct
-                if attempt < self.retry_config.max_retries:
-                    delay = self.retry_config.get_delay(attempt)
-                    time.sleep(delay)
-
-                    # Build correction prompt
-                    correction_prompt = self._build_correction_prompt(e, attempt)
-                    try:
-                        response_text = client.send_message(
-                            system=prompt_system,
-                            user=correction_prompt,
-                        )
-                    except Exception as retry_error:
-                        self.logger.warning(
-                            f"Retry query failed on attempt {attempt + 1}: {str(retry_error)}"
-                        )
-                        # Continue to next retry or fail
-
-        # All retries exhausted
-        assert last_error is not None
-        raise RetryExhaustedError(
-            message=f"Validation failed after {self.retry_config.max_retries + 1} attempts",
-            last_error=last_error,
-            attempts=self.retry_config.max_retries + 1,
-        )
+        # Built once and shared by every correction request
+        system_message = {"role": "system", "content": prompt_system}
+        plan = self._retry_plan(response_text, response_model)
+        try:
+            attempt, deadline, correction_prompt = next(plan)
+            while True:
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._sleep(delay)
+                retry_response: str | None = None
+                try:
+                    retry_response = client.send_messages(
+                        [system_message, {"role": "user", "content": correction_prompt}]
+                    )
+                except Exception as retry_error:
+                    self._log_retry_query_failure(retry_error, attempt)
+                attempt, deadline, correction_prompt = plan.send(retry_response)
+        except StopIteration as done:
+            return cast(ResponseModelT, done.value)
 
     async def validate_with_retries_async(
         self,
-        response_text: str,
+        response_text: str | bytes,
         response_model: type[ResponseModelT],
         client: ChatClient,
         prompt_system: str,
@@ -149,7 +370,7 @@ class ValidationEngine:
         """Async version of validate_with_retries.
 
         Args:
-            response_text: Initial response text from LLM
+            response_text: Initial response text (or UTF-8 bytes) from LLM
             response_model: Pydantic model for validation
             client: Chat client for retry queries
             prompt_system: System prompt (for re-query)
@@ -163,36 +384,99 @@ class ValidationEngine:
             LLMValidationError: If validation consistently fails
             RetryExhaustedError: If all retries are exhausted
         """
-        last_error: Any = None
+        if self.retry_config.max_retries == 0:
+            return self._validate_once(response_text, response_model)
 
-        for attempt in range(self.retry_config.max_retries + 1):
+        # Built once and shared by every correction request
+        system_message = {"role": "system", "content": prompt_system}
+        plan = self._retry_plan(response_text, response_model)
+        try:
+            attempt, deadline, correction_prompt = next(plan)
+            while True:
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await self._async_sleep(delay)
+                retry_response: str | None = None
+                try:
+                    retry_response = await client.send_messages_async(
+                        [system_message, {"role": "user", "content": correction_prompt}]
+                    )
+                except Exception as retry_error:
+                    self._log_retry_query_failure(retry_error, attempt)
+                attempt, deadline, correction_prompt = plan.send(retry_response)
+        except StopIteration as done:
+            return cast(ResponseModelT, done.value)
+
+    def _validate_once(
+        self,
+        response_text: str | bytes,
+        response_model: type[ResponseModelT],
+    ) -> ResponseModelT:
+        """Validate without retries (max_retries == 0), skipping the retry plan.
+
+        Raises:
+            RetryExhaustedError: If the response is invalid
+        """
+        try:
+            return self.validate(response_text, response_model)
+        except (LLMParseError, LLMValidationError) as e:
+            self._log_validation_failure(e, 0)
+            raise self._exhausted(e)
+
+    def _retry_plan(
+        self,
+        response_text: str | bytes,
+        response_model: type[ResponseModelT],
+    ) -> Generator[tuple[int, float, str], str | bytes | None, ResponseModelT]:
+        """Drive the validate/correct cycle shared by the sync and async loops.
+
+        Each failed attempt that still has retries left yields
+        (attempt, deadline, correction_prompt), where deadline is the time.monotonic()
+        value at which the backoff ends; the caller sleeps until then, re-queries the LLM
+        and sends back the new response, or None if the re-query failed (the
+        previous response is then validated again). The validated model is the
+        generator's return value.
+
+        Raises:
+            RetryExhaustedError: If all retries are exhausted
+        """
+        max_retries = self.retry_config.max_retries
+        delays = self.retry_config.delays
+        attempt = 0
+
+        while True:
             try:
                 return self.validate(response_text, response_model)
             except (LLMParseError, LLMValidationError) as e:
-                last_error = e
+                if attempt == max_retries:
+                    self._log_validation_failure(e, attempt)
+                    raise self._exhausted(e)
+                # The backoff starts now, so logging and building the correction
+                # prompt overlap with it instead of adding to it
+                deadline = time.monotonic() + delays[attempt]
                 self._log_validation_failure(e, attempt)
+                correction_prompt = self._build_correction_prompt(e, attempt)
+
+            # Retries remain: ask the LLM to correct its response
+            retry_response = yield attempt, deadline, correction_prompt
+            if retry_response is not None:
+                response_text = retry_response
+            attempt += 1
+
+    def _log_retry_query_failure(self, retry_error: Exception, attempt: int) -> None:
+        """Log a failed correction request; the loop continues to the next attempt."""
+        self.logger.warning("Retry query failed on attempt %d: %s", attempt + 1, retry_error)
+
+    def _exhausted(self, last_error: LLMParseError | LLMValidationError) -> RetryExhaustedError:
+        """Build the error raised once every attempt has failed.
 
-                # If retries remain, ask LLM to correct
-                if attempt < self.retry_config.max_retries:
-                    delay = self.retry_config.get_delay(attempt)
-                    await asyncio.sleep(delay)
-
-                    # Build correction prompt
-                    correction_prompt = self._build_correction_prompt(e, attempt)
-                    try:
-                        response_text = await client.send_message_async(
-                            system=prompt_system,
-                            user=correction_prompt,
-                        )
-                    except Exception as retry_error:
-                        self.logger.warning(
-                            f"Retry query failed on attempt {attempt + 1}: {str(retry_error)}"
-                        )
-                        # Continue to next retry or fail
-
-        # All retries exhausted
-        assert last_error is not None
-        raise RetryExhaustedError(
+        Args:
+            last_error: Error from the final attempt
+
+        Returns:
+            RetryExhaustedError to raise
+        """
+        return RetryExhaustedError(
             message=f"Validation failed after {self.retry_config.max_retries + 1} attempts",
             last_error=last_error,
             attempts=self.retry_config.max_retries + 1,
@@ -211,15 +495,11 @@ class ValidationEngine:
         error_details = error.context.get("validation_errors") or error.context.get("parse_error")
         raw_response = error.context.get("raw_response", "")[:500]
 
-        return f"""Your previous response was invalid (attempt {attempt + 1}).
-
-Error details:
-{json.dumps({"error": error_details}, indent=2)}
-
-Your previous response:
-{raw_response}
-
-Please provide a corrected JSON response that strictly adheres to the schema."""
+        return _CORRECTION_PROMPT_TEMPLATE.format(
+            attempt=attempt + 1,
+            error_details=_json.dumps({"error": error_details}),
+            raw_response=raw_response,
+        )
 
     def _log_validation_failure(
         self,
@@ -232,18 +512,27 @@ Please provide a corrected JSON response that strictly adheres to the schema."""
             error: Validation error
             attempt: Attempt number
         """
-        msg = f"Validation failed (attempt {attempt + 1}/{self.retry_config.max_retries + 1})"
+        # Checked per call rather than once at init: setup_logger reconfigures the
+        # shared named logger on every API call, so its level can change at runtime.
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+
+        # Arguments are handed to the logger, which formats them only if a handler emits
+        msg = "Validation failed (attempt %d/%d)"
+        args: list[Any] = [attempt + 1, self.retry_config.max_retries + 1]
 
         if self.logging_config.include_raw_response:
-            raw = error.context.get("raw_response", "N/A")[:300]
-            msg += f"\n  Raw response: {raw}"
+            msg += "\n  Raw response: %.300s"
+            args.append(error.context.get("raw_response", "N/A"))
 
         if self.logging_config.include_validation_errors:
-            if isinstance(error, LLMValidationError):
-                errors = error.context.get("validation_errors", [])[:2]
-                msg += f"\n  Validation errors: {errors}"
-            elif isinstance(error, LLMParseError):
-                parse_err = error.context.get("parse_error", "Unknown")
-                msg += f"\n  Parse error: {parse_err}"
-
-        self.logger.warning(msg)
+            # Exact type checks: the engine only ever raises these two classes itself
+            error_type = type(error)
+            if error_type is LLMValidationError:
+                msg += "\n  Validation errors: %s"
+                args.append(error.context.get("validation_errors", [])[:2])
+            elif error_type is LLMParseError:
+                msg += "\n  Parse error: %s"
+                args.append(error.context.get("parse_error", "Unknown"))
+
+        self.logger.warning(msg, *args)
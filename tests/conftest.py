@@ -28,6 +28,21 @@ class TestResponseModel(BaseModel):
     language: str
 
 
+@pytest.fixture(scope="module")
+def test_logger() -> logging.Logger:
+    """Logger shared by the tests of a module.
+
+    Records are dropped before formatting, so retry-heavy tests do not write
+    to stderr on every attempt.
+    """
+    logger = logging.getLogger("pydantic_llm_io.test")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.CRITICAL + 1)
+    return logger
+
+
 @pytest.fixture
 def test_prompt() -> TestPromptModel:
     """Create a test prompt model."""
@@ -1,18 +1,22 @@
 """Integration tests for main API."""
 
+import asyncio
 import json
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from pydantic_llm_io import (
     FakeChatClient,
+    InMemoryCache,
+    LLMCacheConfig,
     LLMCallConfig,
     LoggingConfig,
     RetryConfig,
     RetryExhaustedError,
     call_llm_validated,
     call_llm_validated_async,
+    gather_validated,
 )
 
 
@@ -31,6 +35,19 @@ class SummaryOutput(BaseModel):
     language: str
 
 
+class AliasedOutput(BaseModel):
+    """Output model whose JSON keys differ from its field names."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    full_name: str = Field(alias="fullName")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def initial(self) -> str:
+        return self.full_name[:1]
+
+
 class TestCallLLMValidated:
     """Test call_llm_validated function."""
 
@@ -158,6 +175,157 @@ class TestCallLLMValidated:
         assert "My text" in client.last_user
         assert "50" in client.last_user
 
+    def test_plain_dict_prompt(self) -> None:
+        """Test prompts can be plain mappings instead of Pydantic models."""
+        response_data = {"summary": "Sum", "key_points": ["x"], "language": "en"}
+        client = FakeChatClient(json.dumps(response_data))
+
+        result = call_llm_validated(
+            prompt_model={"text": "Dict text", "max_words": 5},
+            response_model=SummaryOutput,
+            client=client,
+            config=LLMCallConfig(logging=LoggingConfig(level="WARNING")),
+        )
+
+        assert result.summary == "Sum"
+        assert client.last_user is not None
+        assert "Dict text" in client.last_user
+
+
+class TestResponseCache:
+    """Test response caching in call_llm_validated."""
+
+    @staticmethod
+    def _config(cache: InMemoryCache, temperature: float = 0.0) -> LLMCallConfig:
+        return LLMCallConfig(
+            cache=LLMCacheConfig(backend=cache),
+            temperature=temperature,
+            logging=LoggingConfig(level="WARNING"),
+        )
+
+    def test_cache_hit_skips_client(self) -> None:
+        """Test repeated deterministic call is served from cache."""
+        response_data = {"summary": "Cached", "key_points": ["a"], "language": "en"}
+        client = FakeChatClient(json.dumps(response_data))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+
+        first = call_llm_validated(prompt, SummaryOutput, client, self._config(cache))
+        second = call_llm_validated(prompt, SummaryOutput, client, self._config(cache))
+
+        assert client.call_count == 1
+        assert len(cache) == 1
+        assert second == first
+
+    def test_non_deterministic_calls_not_cached(self) -> None:
+        """Test calls with temperature > 0 bypass the cache."""
+        response_data = {"summary": "Fresh", "key_points": ["a"], "language": "en"}
+        client = FakeChatClient(json.dumps(response_data))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+
+        call_llm_validated(prompt, SummaryOutput, client, self._config(cache, 0.7))
+        call_llm_validated(prompt, SummaryOutput, client, self._config(cache, 0.7))
+
+        assert client.call_count == 2
+        assert len(cache) == 0
+
+    def test_invalid_cache_entry_is_evicted(self) -> None:
+        """Test a stale entry that fails validation falls through to the client."""
+        response_data = {"summary": "Fresh", "key_points": ["a"], "language": "en"}
+        client = FakeChatClient(json.dumps(response_data))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+
+        call_llm_validated(prompt, SummaryOutput, client, self._config(cache))
+        (key,) = cache._entries
+        cache.set(key, '{"summary": 1}')
+
+        result = call_llm_validated(prompt, SummaryOutput, client, self._config(cache))
+
+        assert result.summary == "Fresh"
+        assert client.call_count == 2
+
+    def test_trusted_cache_skips_validation(self) -> None:
+        """Test trust_cache rebuilds hits with model_construct."""
+        response_data = {"summary": "Cached", "key_points": ["a"], "language": "en"}
+        client = FakeChatClient(json.dumps(response_data))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+        config = LLMCallConfig(
+            cache=LLMCacheConfig(backend=cache, trust_cache=True),
+            temperature=0.0,
+            logging=LoggingConfig(level="WARNING"),
+        )
+
+        call_llm_validated(prompt, SummaryOutput, client, config)
+        (key,) = cache._entries
+        # Not valid for SummaryOutput; returned as-is because validation is skipped
+        cache.set(key, '{"summary": 1, "key_points": [], "language": "en"}')
+
+        result = call_llm_validated(prompt, SummaryOutput, client, config)
+
+        assert isinstance(result, SummaryOutput)
+        assert result.summary == 1
+        assert client.call_count == 1
+
+    def test_trusted_responses_not_cached(self) -> None:
+        """Test unvalidated responses built with trust_responses skip the cache write."""
+        client = FakeChatClient(json.dumps({"summary": 5, "key_points": [], "language": "en"}))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+        config = LLMCallConfig(
+            cache=LLMCacheConfig(backend=cache),
+            temperature=0.0,
+            logging=LoggingConfig(level="WARNING"),
+            trust_responses=True,
+        )
+
+        result = call_llm_validated(prompt, SummaryOutput, client, config)
+
+        assert isinstance(result, SummaryOutput)
+        assert len(cache) == 0
+
+    def test_aliased_model_cache_hit(self) -> None:
+        """Test models with aliases and computed fields round-trip through the cache."""
+        client = FakeChatClient(json.dumps({"fullName": "Ada"}))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+
+        first = call_llm_validated(prompt, AliasedOutput, client, self._config(cache))
+        second = call_llm_validated(prompt, AliasedOutput, client, self._config(cache))
+
+        assert client.call_count == 1
+        assert second == first
+        assert second.initial == "A"
+
+    @pytest.mark.asyncio
+    async def test_async_aliased_model_cache_hit(self) -> None:
+        """Test the async path gets cache hits for aliased models."""
+        client = FakeChatClient(json.dumps({"fullName": "Ada"}))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+
+        first = await call_llm_validated_async(prompt, AliasedOutput, client, self._config(cache))
+        second = await call_llm_validated_async(prompt, AliasedOutput, client, self._config(cache))
+
+        assert client.call_count == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_async_cache_hit(self) -> None:
+        """Test async path shares the cache."""
+        response_data = {"summary": "Cached", "key_points": ["a"], "language": "en"}
+        client = FakeChatClient(json.dumps(response_data))
+        cache = InMemoryCache()
+        prompt = SummaryInput(text="text", max_words=10)
+
+        call_llm_validated(prompt, SummaryOutput, client, self._config(cache))
+        result = await call_llm_validated_async(prompt, SummaryOutput, client, self._config(cache))
+
+        assert result.summary == "Cached"
+        assert client.call_count == 1
+
 
 @pytest.mark.asyncio
 async def test_call_llm_validated_async() -> None:
@@ -219,3 +387,73 @@ async def test_async_retry() -> None:
 
     assert result.summary == "Fixed"
     assert client.call_count == 1  # One retry query
+
+
+class TestGatherValidated:
+    """Test gather_validated batching helper."""
+
+    @staticmethod
+    def _response(summary: str) -> str:
+        return json.dumps({"summary": summary, "key_points": ["a"], "language": "en"})
+
+    @pytest.mark.asyncio
+    async def test_results_in_request_order(self) -> None:
+        """Test results line up with the input requests."""
+        clients = [FakeChatClient(self._response(f"s{i}")) for i in range(5)]
+        prompt = SummaryInput(text="text", max_words=10)
+
+        results = await gather_validated(
+            [(prompt, SummaryOutput, client) for client in clients],
+            LLMCallConfig(logging=LoggingConfig(level="WARNING")),
+            concurrency=2,
+        )
+
+        assert [r.summary for r in results] == ["s0", "s1", "s2", "s3", "s4"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test no more than `concurrency` calls run at once."""
+        in_flight = [0]
+        peak = [0]
+
+        class SlowClient(FakeChatClient):
+            async def send_message_async(
+                self, system: str, user: str, temperature: float = 0.7
+            ) -> str:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.01)
+                in_flight[0] -= 1
+                return self.response_text
+
+        client = SlowClient(self._response("slow"))
+        prompts = [SummaryInput(text=f"text {i}", max_words=10) for i in range(6)]
+
+        await gather_validated(
+            [(prompt, SummaryOutput, client) for prompt in prompts],
+            LLMCallConfig(logging=LoggingConfig(level="WARNING")),
+            concurrency=2,
+        )
+
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_requests_sent_once(self) -> None:
+        """Test identical requests in a batch share one LLM call."""
+        client = FakeChatClient(self._response("shared"))
+        prompt = SummaryInput(text="text", max_words=10)
+
+        results = await gather_validated(
+            [(prompt, SummaryOutput, client)] * 3,
+            LLMCallConfig(logging=LoggingConfig(level="WARNING")),
+        )
+
+        assert client.call_count == 1
+        assert len(results) == 3
+        assert results[0] is results[1] is results[2]
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self) -> None:
+        """Test concurrency validation."""
+        with pytest.raises(ValueError, match="concurrency must be >= 1"):
+            await gather_validated([], concurrency=0)
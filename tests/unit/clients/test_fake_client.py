@@ -37,6 +37,16 @@ class TestFakeChatClient:
         assert client.call_history[0]["system"] == "sys1"
         assert client.call_history[1]["user"] == "usr2"
 
+    def test_fake_client_without_recording(self) -> None:
+        """Test record=False only counts calls."""
+        client = FakeChatClient("response", record=False)
+
+        assert client.send_message(system="sys", user="usr") == "response"
+        assert client.call_count == 1
+        assert client.last_system is None
+        assert client.last_user is None
+        assert client.call_history == []
+
     def test_fake_client_async(self) -> None:
         """Test async method."""
         import asyncio
@@ -49,6 +59,23 @@ class TestFakeChatClient:
         result = asyncio.run(test())
         assert result == "async response"
 
+    def test_fake_client_send_messages(self) -> None:
+        """Test prebuilt message lists route through send_message."""
+        client = FakeChatClient("response")
+
+        result = client.send_messages(
+            [
+                {"role": "system", "content": "sys"},
+                {"role": "user", "content": "usr"},
+            ],
+            temperature=0.2,
+        )
+
+        assert result == "response"
+        assert client.last_system == "sys"
+        assert client.last_user == "usr"
+        assert client.call_history[0]["temperature"] == "0.2"
+
     def test_fake_client_reset(self) -> None:
         """Test reset functionality."""
         client = FakeChatClient("response")
@@ -66,3 +93,11 @@ class TestFakeChatClient:
         """Test provider name."""
         client = FakeChatClient("response")
         assert client.get_provider_name() == "fake"
+
+    def test_instance_methods_can_be_patched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test send_message can be replaced on a single instance."""
+        client = FakeChatClient("response")
+        monkeypatch.setattr(client, "send_message", lambda **kwargs: "patched")
+
+        assert client.send_message(system="s", user="u") == "patched"
+        assert FakeChatClient("response").send_message(system="s", user="u") == "response"
@@ -0,0 +1,89 @@
+"""Tests for OpenAIChatClient construction (no network access)."""
+
+import json
+
+import httpx
+import pytest
+
+from pydantic_llm_io import OpenAIChatClient
+
+
+def _chunk(content: str | None, finish_reason: str | None = None) -> str:
+    """Build one server-sent event carrying a chat completion chunk."""
+    delta = {"content": content} if content is not None else {}
+    payload = {
+        "id": "chatcmpl-test",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+STREAM_BODY = (
+    _chunk('{"name": ')
+    + _chunk('"test"}')
+    + _chunk(None, finish_reason="stop")
+    + "data: [DONE]\n\n"
+)
+
+
+def _stream_handler(request: httpx.Request) -> httpx.Response:
+    assert json.loads(request.content)["stream"] is True
+    return httpx.Response(
+        200,
+        content=STREAM_BODY.encode(),
+        headers={"content-type": "text/event-stream"},
+    )
+
+
+class TestOpenAIChatClient:
+    """Test OpenAIChatClient setup."""
+
+    def test_sync_connection_pool_shared(self) -> None:
+        """Test instances share one pooled sync httpx client by default."""
+        first = OpenAIChatClient(api_key="sk-test")
+        second = OpenAIChatClient(api_key="sk-test")
+
+        assert first.client._client is second.client._client
+
+    def test_custom_http_clients(self) -> None:
+        """Test explicitly provided httpx clients are used."""
+        http_client = httpx.Client()
+        async_http_client = httpx.AsyncClient()
+
+        client = OpenAIChatClient(
+            api_key="sk-test",
+            http_client=http_client,
+            async_http_client=async_http_client,
+        )
+
+        assert client.client._client is http_client
+        assert client.async_client._client is async_http_client
+        http_client.close()
+
+    def test_provider_name(self) -> None:
+        """Test provider name."""
+        assert OpenAIChatClient(api_key="sk-test").get_provider_name() == "openai"
+
+    def test_streamed_content_is_assembled(self) -> None:
+        """Test streamed chunks are joined into the full response."""
+        client = OpenAIChatClient(
+            api_key="sk-test",
+            http_client=httpx.Client(transport=httpx.MockTransport(_stream_handler)),
+            stream=True,
+        )
+
+        assert client.send_message(system="s", user="u") == '{"name": "test"}'
+
+    @pytest.mark.asyncio
+    async def test_streamed_content_is_assembled_async(self) -> None:
+        """Test streamed chunks are joined into the full response (async)."""
+        client = OpenAIChatClient(
+            api_key="sk-test",
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(_stream_handler)),
+            stream=True,
+        )
+
+        assert await client.send_message_async(system="s", user="u") == '{"name": "test"}'
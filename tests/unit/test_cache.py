@@ -0,0 +1,82 @@
+"""Tests for response caching."""
+
+import pytest
+
+from pydantic_llm_io import CacheBackend, InMemoryCache, LLMCacheConfig
+from pydantic_llm_io.cache import make_cache_key
+
+
+class TestInMemoryCache:
+    """Test InMemoryCache backend."""
+
+    def test_get_set_delete(self) -> None:
+        """Test basic cache operations."""
+        cache = InMemoryCache()
+        assert cache.get("k") is None
+
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+
+        cache.delete("k")
+        assert cache.get("k") is None
+        cache.delete("missing")  # No error
+
+    def test_lru_eviction(self) -> None:
+        """Test least recently used entry is evicted when full."""
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # 'b' is now least recently used
+        cache.set("c", "3")
+
+        assert len(cache) == 2
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_invalid_max_entries(self) -> None:
+        """Test max_entries validation."""
+        with pytest.raises(ValueError, match="max_entries must be >= 1"):
+            InMemoryCache(max_entries=0)
+
+    def test_satisfies_protocol(self) -> None:
+        """Test InMemoryCache implements CacheBackend."""
+        assert isinstance(InMemoryCache(), CacheBackend)
+
+
+class TestCacheKey:
+    """Test cache key construction."""
+
+    def test_key_is_stable(self) -> None:
+        """Test identical requests map to the same key."""
+        key1 = make_cache_key("openai", "gpt-4o", "sys", "usr", 0.0)
+        key2 = make_cache_key("openai", "gpt-4o", "sys", "usr", 0.0)
+        assert key1 == key2
+
+    def test_key_depends_on_request(self) -> None:
+        """Test any request parameter change produces a new key."""
+        base = make_cache_key("openai", "gpt-4o", "sys", "usr", 0.0)
+        assert make_cache_key("fake", "gpt-4o", "sys", "usr", 0.0) != base
+        assert make_cache_key("openai", "gpt-4o-mini", "sys", "usr", 0.0) != base
+        assert make_cache_key("openai", "gpt-4o", "sys2", "usr", 0.0) != base
+        assert make_cache_key("openai", "gpt-4o", "sys", "usr2", 0.0) != base
+        assert make_cache_key("openai", "gpt-4o", "sys", "usr", 0.5) != base
+
+
+class TestLLMCacheConfig:
+    """Test LLMCacheConfig dataclass."""
+
+    def test_disabled_without_backend(self) -> None:
+        """Test caching is off by default."""
+        assert LLMCacheConfig().is_enabled_for(0.0) is False
+
+    def test_deterministic_only(self) -> None:
+        """Test only temperature 0 calls are cached by default."""
+        config = LLMCacheConfig(backend=InMemoryCache())
+        assert config.is_enabled_for(0.0) is True
+        assert config.is_enabled_for(0.7) is False
+
+    def test_cache_all_temperatures(self) -> None:
+        """Test deterministic_only can be disabled."""
+        config = LLMCacheConfig(backend=InMemoryCache(), deterministic_only=False)
+        assert config.is_enabled_for(0.7) is True
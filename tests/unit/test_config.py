@@ -1,5 +1,7 @@
 """Tests for configuration module."""
 
+from dataclasses import asdict, fields
+
 import pytest
 
 from pydantic_llm_io import ConfigError, LoggingConfig, LLMCallConfig, RetryConfig
@@ -26,6 +28,31 @@ class TestRetryConfig:
         assert config.get_delay(1) == 2.0  # 1 * 2^1
         assert config.get_delay(2) == 4.0  # 1 * 2^2
 
+    def test_delay_beyond_schedule(self) -> None:
+        """Test delays past max_retries are still computed."""
+        config = RetryConfig(max_retries=1, initial_delay_seconds=1.0, backoff_multiplier=2.0)
+        assert config.get_delay(1) == 2.0
+        assert config.get_delay(5) == 32.0
+
+    def test_delay_schedule(self) -> None:
+        """Test the precomputed schedule matches get_delay for every attempt."""
+        config = RetryConfig(max_retries=3, initial_delay_seconds=0.5, backoff_multiplier=3.0)
+        assert config.delays == tuple(config.get_delay(i) for i in range(4))
+
+    def test_retry_config_equality(self) -> None:
+        """Test the precomputed schedule is not part of the dataclass fields."""
+        assert RetryConfig(max_retries=2) == RetryConfig(max_retries=2)
+        assert [f.name for f in fields(RetryConfig)] == [
+            "max_retries",
+            "initial_delay_seconds",
+            "backoff_multiplier",
+        ]
+        assert asdict(RetryConfig(max_retries=2)) == {
+            "max_retries": 2,
+            "initial_delay_seconds": 1.0,
+            "backoff_multiplier": 2.0,
+        }
+
     def test_retry_config_validation(self) -> None:
         """Test RetryConfig validation."""
         with pytest.raises(ValueError, match="max_retries must be >= 0"):
@@ -84,6 +111,7 @@ class TestLLMCallConfig:
         config = LLMCallConfig()
         assert config.temperature == 0.7
         assert config.custom_system_prompt is None
+        assert config.trust_responses is False
         assert isinstance(config.retry, RetryConfig)
         assert isinstance(config.logging, LoggingConfig)
 
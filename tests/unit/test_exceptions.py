@@ -1,5 +1,8 @@
 """Tests for exception classes."""
 
+import pickle
+import sys
+
 import pytest
 
 from pydantic_llm_io import (
@@ -36,6 +39,14 @@ class TestLLMIOError:
         assert error_dict["message"] == "Test error"
         assert error_dict["context"] == {"info": "data"}
 
+    def test_error_to_dict_memoized(self) -> None:
+        """Test to_dict is built once and refreshed when the error is modified."""
+        error = LLMIOError("Test error", context={"info": "data"})
+        assert error.to_dict() is error.to_dict()
+
+        error.message = "Changed"
+        assert error.to_dict()["message"] == "Changed"
+
 
 class TestLLMCallError:
     """Test LLMCallError."""
@@ -138,3 +149,40 @@ class TestConfigError:
         """Test config error without key."""
         error = ConfigError("Invalid config")
         assert "config_key" not in error.context
+
+
+class TestPickling:
+    """Test errors survive a pickle round trip (e.g. across process pools)."""
+
+    def test_base_error_round_trip(self) -> None:
+        """Test base error keeps message and context."""
+        error = pickle.loads(pickle.dumps(LLMIOError("Test error", context={"k": 1})))
+        assert error.message == "Test error"
+        assert error.context == {"k": 1}
+        assert str(error) == "Test error"
+
+    def test_subclass_round_trip(self) -> None:
+        """Test subclasses with custom constructors unpickle to the same state."""
+        original = LLMParseError(
+            message="Parse failed",
+            raw_response="bad json",
+            parse_error=ValueError("Error"),
+            attempt=1,
+        )
+        error = pickle.loads(pickle.dumps(original))
+        assert type(error) is LLMParseError
+        assert error.message == original.message
+        assert error.context == original.context
+        assert error.to_dict() == original.to_dict()
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="add_note requires Python 3.11")
+    def test_notes_and_attributes_round_trip(self) -> None:
+        """Test notes and ad-hoc attributes survive unpickling."""
+        original = LLMIOError("Test error")
+        original.add_note("while calling the API")  # type: ignore[attr-defined]
+        original.request_id = "abc"  # type: ignore[attr-defined]
+
+        error = pickle.loads(pickle.dumps(original))
+
+        assert error.__notes__ == ["while calling the API"]
+        assert error.request_id == "abc"
@@ -0,0 +1,58 @@
+"""Tests for JSON serialization helpers."""
+
+import datetime
+import enum
+
+import pytest
+
+from pydantic_llm_io import _json
+
+
+class Color(enum.Enum):
+    """Plain (non-str, non-int) enum."""
+
+    RED = 1
+
+
+SAMPLE = {"b": [1, 2.5, None], "a": {"text": "café"}, "when": object}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run a test against each available backend."""
+    if request.param and not _json._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json, "_HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestDumps:
+    """Test _json.dumps output is identical across backends."""
+
+    def test_compact(self, backend: bool) -> None:
+        """Test compact output."""
+        assert _json.dumps({"a": 1, "b": "x"}) == '{"a":1,"b":"x"}'
+
+    def test_indent(self, backend: bool) -> None:
+        """Test 2-space indentation."""
+        assert _json.dumps({"a": [1]}, indent=True) == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_sort_keys_and_unicode(self, backend: bool) -> None:
+        """Test key sorting, unescaped non-ASCII and str() fallback."""
+        result = _json.dumps(SAMPLE, sort_keys=True)
+        assert result.startswith('{"a":{"text":"café"},"b":[1,2.5,null],"when":')
+
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            (datetime.datetime(2024, 1, 1, 12), '"2024-01-01T12:00:00"'),
+            (datetime.date(2024, 1, 1), '"2024-01-01"'),
+            (Color.RED, "1"),
+            ({1: "a", None: "b", 1.5: "c"}, '{"1":"a","null":"b","1.5":"c"}'),
+            (2**70, "1180591620717411303424"),
+        ],
+        ids=["datetime", "date", "enum", "non-str-keys", "big-int"],
+    )
+    def test_non_json_types(self, backend: bool, obj: object, expected: str) -> None:
+        """Test types orjson handles natively serialize the same on both backends."""
+        assert _json.dumps(obj) == expected
@@ -0,0 +1,37 @@
+"""Tests for logging setup."""
+
+import logging
+
+from pydantic_llm_io import LoggingConfig
+from pydantic_llm_io.logging import setup_logger
+
+
+class TestSetupLogger:
+    """Test setup_logger."""
+
+    def test_handler_reused(self) -> None:
+        """Test repeated setup keeps a single handler."""
+        logger = setup_logger("pydantic_llm_io.test.reuse", LoggingConfig())
+        handler = logger.handlers[0]
+
+        setup_logger("pydantic_llm_io.test.reuse", LoggingConfig())
+
+        assert logger.handlers == [handler]
+
+    def test_level_updated(self) -> None:
+        """Test the level follows the latest config."""
+        logger = setup_logger("pydantic_llm_io.test.level", LoggingConfig(level="DEBUG"))
+        assert logger.level == logging.DEBUG
+
+        setup_logger("pydantic_llm_io.test.level", LoggingConfig(level="ERROR"))
+        assert logger.level == logging.ERROR
+
+    def test_foreign_handlers_replaced(self) -> None:
+        """Test handlers added elsewhere are cleared, as on first setup."""
+        logger = setup_logger("pydantic_llm_io.test.foreign", LoggingConfig())
+        logger.addHandler(logging.NullHandler())
+
+        setup_logger("pydantic_llm_io.test.foreign", LoggingConfig())
+
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.StreamHandler)
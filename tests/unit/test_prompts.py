@@ -1,9 +1,20 @@
 """Tests for prompt building."""
 
+import datetime
+from dataclasses import dataclass
+from typing import TypedDict
+
 import pytest
 from pydantic import BaseModel
 
-from pydantic_llm_io.prompts import DEFAULT_SYSTEM_PROMPT, PromptBuilder
+from pydantic_llm_io import prompts
+from pydantic_llm_io.prompts import (
+    DEFAULT_SYSTEM_PROMPT,
+    PromptBuilder,
+    get_response_schema,
+    get_system_prompt,
+    render_user,
+)
 
 
 class SamplePrompt(BaseModel):
@@ -19,6 +30,36 @@ class SampleResponse(BaseModel):
     result: str
 
 
+@dataclass(slots=True)
+class SamplePromptData:
+    """Sample prompt as a dataclass."""
+
+    text: str
+    max_tokens: int
+
+
+class DatedPrompt(BaseModel):
+    """Prompt model with a datetime field."""
+
+    text: str
+    sent: datetime.datetime
+
+
+@dataclass
+class DatedPromptData:
+    """Dataclass equivalent of DatedPrompt."""
+
+    text: str
+    sent: datetime.datetime
+
+
+class SamplePromptDict(TypedDict):
+    """Sample prompt as a TypedDict."""
+
+    text: str
+    max_tokens: int
+
+
 class TestPromptBuilder:
     """Test PromptBuilder."""
 
@@ -38,7 +79,7 @@ class TestPromptBuilder:
         """Test building system and user messages."""
         builder = PromptBuilder()
         prompt = SamplePrompt(text="Hello", max_tokens=100)
-        schema = SampleResponse.model_json_schema()
+        schema = get_response_schema(SampleResponse)
 
         system, user = builder.build(prompt, schema)
 
@@ -52,6 +93,27 @@ class TestPromptBuilder:
         assert '"Hello"' in user
         assert '"max_tokens"' in user
 
+    def test_build_with_response_model(self) -> None:
+        """Test passing the response model class uses the cached system prompt."""
+        builder = PromptBuilder(custom_system_prompt="Custom")
+        prompt = SamplePrompt(text="Hello", max_tokens=100)
+
+        system, _ = builder.build(prompt, SampleResponse)
+
+        assert system is get_system_prompt(SampleResponse, "Custom")
+        assert system == builder.build(prompt, get_response_schema(SampleResponse))[0]
+
+    def test_pretty_schema(self) -> None:
+        """Test the embedded schema is compact unless pretty_schema is set."""
+        prompt = SamplePrompt(text="Hello", max_tokens=100)
+
+        compact, _ = PromptBuilder().build(prompt, SampleResponse)
+        pretty, _ = PromptBuilder(pretty_schema=True).build(prompt, SampleResponse)
+
+        assert '\n  "properties"' not in compact
+        assert '\n  "properties"' in pretty
+        assert len(compact) < len(pretty)
+
     def test_build_user_message(self) -> None:
         """Test user message construction."""
         builder = PromptBuilder()
@@ -77,10 +139,149 @@ class TestPromptBuilder:
     def test_schema_in_system_prompt(self) -> None:
         """Test that schema is properly formatted in system prompt."""
         builder = PromptBuilder()
-        schema = SampleResponse.model_json_schema()
+        schema = get_response_schema(SampleResponse)
 
         system, _ = builder.build(SamplePrompt(text="x", max_tokens=1), schema)
 
         # Check for JSON code block formatting
         assert "```json" in system
         assert "```" in system
+
+
+class TestSpecializedPromptBuilder:
+    """Test builders specialized to a prompt type and response model."""
+
+    def test_matches_generic_build(self) -> None:
+        """Test specialized builders produce the same messages as build()."""
+        builder = PromptBuilder(custom_system_prompt="Custom")
+        prompt = SamplePrompt(text="Hello", max_tokens=100)
+        data = SamplePromptData(text="Hello", max_tokens=100)
+
+        assert builder.specialize(SamplePrompt, SampleResponse).build(prompt) == builder.build(
+            prompt, SampleResponse
+        )
+        assert builder.specialize(SamplePromptData, SampleResponse).build(data) == builder.build(
+            data, SampleResponse
+        )
+
+    def test_other_prompt_types_render_fully(self) -> None:
+        """Test subclass and unrelated prompts are not cut down to prompt_cls's fields."""
+
+        class ExtendedPrompt(SamplePrompt):
+            extra: str
+
+        specialized = PromptBuilder().specialize(SamplePrompt, SampleResponse)
+        extended = ExtendedPrompt(text="Hello", max_tokens=1, extra="hi")
+        other = DatedPrompt(text="Hello", sent=datetime.datetime(2024, 1, 1))
+
+        assert specialized.build(extended)[1] == render_user(extended)
+        assert '"extra":"hi"' in specialized.build(extended)[1]
+        assert specialized.build(other)[1] == render_user(other)
+
+    def test_specialization_cached(self) -> None:
+        """Test equivalent builders share one specialization."""
+        first = PromptBuilder().specialize(SamplePrompt, SampleResponse)
+
+        assert PromptBuilder().specialize(SamplePrompt, SampleResponse) is first
+        pretty = PromptBuilder(pretty_schema=True).specialize(SamplePrompt, SampleResponse)
+        assert pretty is not first
+        assert first.system is get_system_prompt(SampleResponse)
+
+
+class TestRenderUser:
+    """Test user message rendering for the supported prompt input types."""
+
+    def test_inputs_render_identically(self) -> None:
+        """Test models, dataclasses and mappings produce the same JSON."""
+        expected = render_user(SamplePrompt(text="Hello", max_tokens=100))
+
+        assert render_user(SamplePromptData(text="Hello", max_tokens=100)) == expected
+        assert render_user(SamplePromptDict(text="Hello", max_tokens=100)) == expected
+
+    def test_non_json_types_render_like_models(self) -> None:
+        """Test datetimes in dataclasses and mappings render as model_dump_json does."""
+        sent = datetime.datetime(2024, 1, 1, 12)
+        expected = render_user(DatedPrompt(text="Hello", sent=sent))
+
+        assert render_user(DatedPromptData(text="Hello", sent=sent)) == expected
+        assert render_user({"text": "Hello", "sent": sent}) == expected
+
+    def test_non_str_mapping_keys(self) -> None:
+        """Test mappings with non-str keys are rendered rather than rejected."""
+        assert render_user({1: "a"}) == '{"1":"a"}'  # type: ignore[dict-item]
+
+    def test_compact_output(self) -> None:
+        """Test the user message is compact JSON without indentation."""
+        assert render_user(SamplePrompt(text="Hello", max_tokens=100)) == (
+            '{"text":"Hello","max_tokens":100}'
+        )
+
+    def test_unsupported_input(self) -> None:
+        """Test unsupported prompt inputs are rejected."""
+        with pytest.raises(TypeError, match="prompt_model must be"):
+            render_user(["not", "a", "mapping"])  # type: ignore[arg-type]
+
+    def test_dataclass_class_rejected(self) -> None:
+        """Test passing the dataclass type instead of an instance is rejected."""
+        with pytest.raises(TypeError):
+            render_user(SamplePromptData)  # type: ignore[arg-type]
+
+
+class TestSystemPromptCache:
+    """Test per-response-model schema and system prompt caching."""
+
+    def test_schema_cached_per_model(self) -> None:
+        """Test the schema is generated once per response model class."""
+        first = get_response_schema(SampleResponse)
+        assert get_response_schema(SampleResponse) is first
+        assert first == SampleResponse.model_json_schema()
+
+    def test_system_prompt_matches_builder(self) -> None:
+        """Test the cached prompt equals what PromptBuilder renders."""
+        schema = get_response_schema(SampleResponse)
+
+        assert get_system_prompt(SampleResponse) == PromptBuilder()._build_system(schema)
+        assert get_system_prompt(SampleResponse, "Custom") == PromptBuilder("Custom")._build_system(
+            schema
+        )
+
+    def test_system_prompt_reused(self) -> None:
+        """Test repeated lookups return the same string object."""
+        assert get_system_prompt(SampleResponse, "Reuse") is get_system_prompt(
+            SampleResponse, "Reuse"
+        )
+
+    def test_subclass_does_not_inherit_cached_schema(self) -> None:
+        """Test a subclass gets its own schema rather than its parent's."""
+
+        class ExtendedResponse(SampleResponse):
+            extra: int
+
+        get_response_schema(SampleResponse)
+
+        assert "extra" in get_response_schema(ExtendedResponse)["properties"]
+        assert "extra" not in get_response_schema(SampleResponse)["properties"]
+
+    def test_schema_serialized_once_across_custom_prompts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test new custom prompts reuse the model's serialized schema."""
+
+        class FreshResponse(BaseModel):
+            answer: str
+
+        calls: list[object] = []
+        real_dumps = prompts._json.dumps
+
+        def counting_dumps(obj: object, **kwargs: bool) -> str:
+            calls.append(obj)
+            return real_dumps(obj, **kwargs)
+
+        monkeypatch.setattr(prompts._json, "dumps", counting_dumps)
+
+        first = get_system_prompt(FreshResponse, "First")
+        second = get_system_prompt(FreshResponse, "Second")
+
+        assert len(calls) == 1
+        assert first.startswith("First") and second.startswith("Second")
+        assert first.split("\n", 1)[1] == second.split("\n", 1)[1]
@@ -0,0 +1,41 @@
+"""Fixtures for validation engine tests."""
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pydantic_llm_io import LoggingConfig, RetryConfig
+from pydantic_llm_io.validation import ValidationEngine
+
+
+@pytest.fixture(scope="module")
+def engine(test_logger: logging.Logger) -> ValidationEngine:
+    """Engine with default settings and a tiny backoff, shared by a module's tests.
+
+    ValidationEngine keeps no per-call state, so sharing one instance is safe.
+    """
+    return ValidationEngine(
+        retry_config=RetryConfig(initial_delay_seconds=0.001),
+        logging_config=LoggingConfig(),
+        logger=test_logger,
+    )
+
+
+@pytest.fixture
+def make_engine(test_logger: logging.Logger) -> Callable[..., ValidationEngine]:
+    """Factory for engines with a custom retry config or engine options."""
+
+    def factory(
+        retry_config: RetryConfig | None = None,
+        **kwargs: Any,
+    ) -> ValidationEngine:
+        return ValidationEngine(
+            retry_config=retry_config or RetryConfig(initial_delay_seconds=0.001),
+            logging_config=LoggingConfig(),
+            logger=test_logger,
+            **kwargs,
+        )
+
+    return factory
@@ -1,11 +1,11 @@
 """Tests for validation engine."""
 
-import asyncio
 import json
 import logging
+from collections.abc import Callable
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Json
 
 from pydantic_llm_io import (
     FakeChatClient,
@@ -25,54 +25,193 @@ class SampleModel(BaseModel):
     value: int
 
 
+class JsonFieldModel(BaseModel):
+    """Model with a field holding embedded JSON text."""
+
+    payload: Json[dict[str, int]]
+
+
 class TestValidationEngine:
     """Test ValidationEngine."""
 
-    def test_validate_success(self) -> None:
-        """Test successful validation."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
-        )
+    @pytest.mark.parametrize(
+        ("raw", "expected_error"),
+        [
+            (json.dumps({"name": "test", "value": 42}), None),
+            (b'{"name": "test", "value": 42}', None),  # raw UTF-8 bytes
+            ('{"invalid": json}', LLMParseError),
+            (json.dumps({"name": "test"}), LLMValidationError),  # missing 'value'
+        ],
+        ids=["success", "bytes", "invalid_json", "invalid_schema"],
+    )
+    def test_validate(
+        self,
+        engine: ValidationEngine,
+        raw: str | bytes,
+        expected_error: type[Exception] | None,
+    ) -> None:
+        """Test validation outcomes for valid, malformed and schema-violating responses."""
+        if expected_error is not None:
+            with pytest.raises(expected_error):
+                engine.validate(raw, SampleModel)
+            return
+
+        result = engine.validate(raw, SampleModel)
 
-        valid_json = json.dumps({"name": "test", "value": 42})
-        result = engine.validate(valid_json, SampleModel)
+        assert result.name == "test"
+        assert result.value == 42
+
+    def test_validate_invalid_schema_details(self, engine: ValidationEngine) -> None:
+        """Test validation errors report pydantic's error details."""
+        invalid_json = json.dumps({"name": "test"})  # missing 'value'
+        with pytest.raises(LLMValidationError) as exc_info:
+            engine.validate(invalid_json, SampleModel)
+
+        errors = exc_info.value.context["validation_errors"]
+        assert str(exc_info.value).startswith("Pydantic validation failed: 1 error(s)")
+        assert errors[0]["type"] == "missing"
+        assert "url" not in errors[0]
+
+    def test_validate_parse_error_context(self, engine: ValidationEngine) -> None:
+        """Test parse errors carry the decoder message and the raw response."""
+        with pytest.raises(LLMParseError) as exc_info:
+            engine.validate(b'{"name": ', SampleModel)
+
+        assert exc_info.value.message.startswith("JSON parsing failed: ")
+        assert exc_info.value.context["raw_response"] == '{"name": '
+        assert "EOF" in exc_info.value.context["parse_error"]
+
+    def test_validate_errors_do_not_chain_raw_response(self, engine: ValidationEngine) -> None:
+        """Test raised errors do not keep the full response alive via __context__."""
+        long_invalid = '{"name": "' + "x" * 5000
+
+        with pytest.raises(LLMParseError) as parse_info:
+            engine.validate(long_invalid, SampleModel)
+        with pytest.raises(LLMValidationError) as validation_info:
+            engine.validate('{"name": "test"}', SampleModel)
+
+        assert parse_info.value.__context__ is None
+        assert validation_info.value.__context__ is None
+        assert len(parse_info.value.context["raw_response"]) <= 1000
+
+    def test_validate_bytes_error_keeps_bounded_prefix(self, engine: ValidationEngine) -> None:
+        """Test a large invalid bytes response is decoded only up to the stored limit."""
+        raw = ('{"name": "' + "日本" * 5000).encode("utf-8")
+
+        with pytest.raises(LLMParseError) as exc_info:
+            engine.validate(raw, SampleModel)
+
+        stored = exc_info.value.context["raw_response"]
+        assert len(stored) == 1000
+        assert raw.decode("utf-8").startswith(stored)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '```json\n{"name": "test", "value": 42}\n```',
+            'Here is the JSON: {"name": "test", "value": 42}. Hope it helps!',
+            b'```json\n{"name": "test", "value": 42}\n```',
+            'See [1] and [2]: {"name": "test", "value": 42}',
+            'Answer [draft]: {"name": "test", "value": 42} [end]',
+        ],
+    )
+    def test_validate_extracts_wrapped_json(
+        self,
+        engine: ValidationEngine,
+        raw: str | bytes,
+    ) -> None:
+        """Test JSON wrapped in fences or prose is recovered without a retry."""
+        result = engine.validate(raw, SampleModel)
 
         assert result.name == "test"
         assert result.value == 42
 
-    def test_validate_invalid_json(self) -> None:
-        """Test validation with invalid JSON."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
-        )
+    def test_validate_extracted_json_reports_schema_errors(
+        self,
+        engine: ValidationEngine,
+    ) -> None:
+        """Test wrapped JSON that fails the schema raises a validation error."""
+        with pytest.raises(LLMValidationError):
+            engine.validate('```json\n{"name": "test"}\n```', SampleModel)
+
+    def test_validate_invalid_json_field_is_validation_error(
+        self,
+        engine: ValidationEngine,
+    ) -> None:
+        """Test malformed JSON inside a Json[...] field is not a parse error."""
+        with pytest.raises(LLMValidationError) as exc_info:
+            engine.validate('{"payload": "not json"}', JsonFieldModel)
+
+        assert exc_info.value.context["validation_errors"][0]["loc"] == ("payload",)
+
+    def test_validate_trusted_response_skips_validation(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test trust_responses builds the model without validating it."""
+        engine = make_engine(trust_responses=True)
+
+        result = engine.validate('{"name": "test"}', SampleModel)  # missing 'value'
+
+        assert result.name == "test"
+        assert "value" not in result.model_fields_set
+
+    def test_validate_trusted_response_still_reports_parse_errors(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test trust_responses does not hide malformed JSON."""
+        engine = make_engine(trust_responses=True)
 
         with pytest.raises(LLMParseError):
             engine.validate('{"invalid": json}', SampleModel)
 
-    def test_validate_invalid_schema(self) -> None:
-        """Test validation with invalid schema."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
+    def test_validate_many(self, engine: ValidationEngine) -> None:
+        """Test batch validation returns results and errors in input order."""
+        results = engine.validate_many(
+            [
+                '{"name": "a", "value": 1}',
+                '{"invalid": json}',
+                b'{"name": "c", "value": 3}',
+                '{"name": "d"}',
+            ],
+            SampleModel,
         )
 
-        invalid_json = json.dumps({"name": "test"})  # missing 'value'
-        with pytest.raises(LLMValidationError):
-            engine.validate(invalid_json, SampleModel)
+        assert len(results) == 4
+        assert isinstance(results[0], SampleModel) and results[0].name == "a"
+        assert isinstance(results[1], LLMParseError)
+        assert isinstance(results[2], SampleModel) and results[2].value == 3
+        assert isinstance(results[3], LLMValidationError)
 
-    def test_validate_with_retries_success_first_try(self) -> None:
-        """Test validate_with_retries succeeds on first attempt."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(initial_delay_seconds=0.001),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
+    def test_validate_batch(self, engine: ValidationEngine) -> None:
+        """Test batch validation returns every model in order."""
+        results = engine.validate_batch(
+            ['{"name": "a", "value": 1}', b'{"name": "b", "value": 2}'], SampleModel
         )
 
+        assert [r.name for r in results] == ["a", "b"]
+        assert engine.validate_batch([b'{"name": "c", "value": 3}'], SampleModel)[0].value == 3
+
+    def test_validate_batch_fails_as_a_whole(self, engine: ValidationEngine) -> None:
+        """Test one invalid response fails the batch, reporting its index."""
+        with pytest.raises(LLMValidationError) as exc_info:
+            engine.validate_batch(['{"name": "a", "value": 1}', '{"name": "b"}'], SampleModel)
+
+        assert exc_info.value.context["validation_errors"][0]["loc"] == (1, "value")
+
+        with pytest.raises(LLMParseError):
+            engine.validate_batch(['{"name": "a", "value": 1}', '{"invalid": json}'], SampleModel)
+
+    def test_validate_batch_rejects_multi_value_response(self, engine: ValidationEngine) -> None:
+        """Test a response holding several JSON values cannot pad the batch."""
+        with pytest.raises(LLMParseError, match="expected 1 JSON values, got 2"):
+            engine.validate_batch(
+                ['{"name": "a", "value": 1},{"name": "b", "value": 2}'], SampleModel
+            )
+
+    def test_validate_with_retries_success_first_try(self, engine: ValidationEngine) -> None:
+        """Test validate_with_retries succeeds on first attempt."""
         valid_json = json.dumps({"name": "test", "value": 42})
         client = FakeChatClient(valid_json)
 
@@ -87,16 +226,12 @@ class TestValidationEngine:
         assert result.name == "test"
         assert client.call_count == 0  # No retry queries
 
-    def test_validate_with_retries_after_error(self) -> None:
+    def test_validate_with_retries_after_error(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
         """Test validate_with_retries succeeds after retry."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(
-                max_retries=2,
-                initial_delay_seconds=0.001,
-            ),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
-        )
+        engine = make_engine(RetryConfig(max_retries=2, initial_delay_seconds=0.001))
 
         valid_json = json.dumps({"name": "test", "value": 42})
         client = FakeChatClient(valid_json)
@@ -114,17 +249,17 @@ class TestValidationEngine:
 
         assert result.name == "test"
         assert client.call_count == 1  # One retry query
-
-    def test_validate_with_retries_exhausted(self) -> None:
+        assert client.last_system == "sys"
+        assert client.last_user is not None
+        assert client.last_user.startswith("Your previous response was invalid (attempt 1).")
+        assert invalid_json in client.last_user
+
+    def test_validate_with_retries_exhausted(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
         """Test validate_with_retries after exhausting retries."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(
-                max_retries=1,
-                initial_delay_seconds=0.001,
-            ),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
-        )
+        engine = make_engine(RetryConfig(max_retries=1, initial_delay_seconds=0.001))
 
         # Always return invalid JSON
         client = FakeChatClient('{"invalid": json}')
@@ -141,14 +276,8 @@ class TestValidationEngine:
         assert exc_info.value.context["attempts"] == 2  # max_retries + 1
 
     @pytest.mark.asyncio
-    async def test_validate_with_retries_async_success(self) -> None:
+    async def test_validate_with_retries_async_success(self, engine: ValidationEngine) -> None:
         """Test async validation succeeds."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(initial_delay_seconds=0.001),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
-        )
-
         valid_json = json.dumps({"name": "test", "value": 42})
         client = FakeChatClient(valid_json)
 
@@ -163,17 +292,33 @@ class TestValidationEngine:
         assert result.name == "test"
 
     @pytest.mark.asyncio
-    async def test_validate_with_retries_async_exhausted(self) -> None:
-        """Test async validation exhaustion."""
-        engine = ValidationEngine(
-            retry_config=RetryConfig(
-                max_retries=1,
-                initial_delay_seconds=0.001,
-            ),
-            logging_config=LoggingConfig(),
-            logger=logging.getLogger("test"),
+    async def test_validate_with_retries_async_after_error(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test async validation succeeds after a correction round-trip."""
+        engine = make_engine(RetryConfig(max_retries=2, initial_delay_seconds=0.001))
+        client = FakeChatClient(json.dumps({"name": "test", "value": 42}))
+
+        result = await engine.validate_with_retries_async(
+            response_text='{"invalid": json}',
+            response_model=SampleModel,
+            client=client,
+            prompt_system="sys",
+            prompt_user="usr",
         )
 
+        assert result.name == "test"
+        assert client.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_validate_with_retries_async_exhausted(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test async validation exhaustion."""
+        engine = make_engine(RetryConfig(max_retries=1, initial_delay_seconds=0.001))
+
         client = FakeChatClient('{"invalid": json}')
 
         with pytest.raises(RetryExhaustedError):
@@ -184,3 +329,128 @@ class TestValidationEngine:
                 prompt_system="sys",
                 prompt_user="usr",
             )
+
+    def test_validate_with_retries_no_retries(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test max_retries=0 validates once and never re-queries."""
+        engine = make_engine(RetryConfig(max_retries=0))
+        client = FakeChatClient(json.dumps({"name": "test", "value": 42}))
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            engine.validate_with_retries(
+                response_text='{"invalid": json}',
+                response_model=SampleModel,
+                client=client,
+                prompt_system="sys",
+                prompt_user="usr",
+            )
+
+        assert exc_info.value.context["attempts"] == 1
+        assert exc_info.value.context["last_error"]["error"] == "LLMParseError"
+        assert client.call_count == 0
+
+    def test_zero_delay_skips_sleep(self, make_engine: Callable[..., ValidationEngine]) -> None:
+        """Test retries with a zero backoff delay never call time.sleep."""
+        sleeps: list[float] = []
+        engine = make_engine(
+            RetryConfig(max_retries=2, initial_delay_seconds=0), sleep=sleeps.append
+        )
+        client = FakeChatClient('{"invalid": json}')
+
+        with pytest.raises(RetryExhaustedError):
+            engine.validate_with_retries(
+                response_text='{"invalid": json}',
+                response_model=SampleModel,
+                client=client,
+                prompt_system="sys",
+                prompt_user="usr",
+            )
+
+        assert client.call_count == 2
+        assert sleeps == []
+
+    def test_validation_failure_not_formatted_when_warning_disabled(self) -> None:
+        """Test failure logging does no work when WARNING is disabled."""
+        logger = logging.getLogger("test.engine.quiet")
+        logger.setLevel(logging.ERROR)
+        engine = ValidationEngine(
+            retry_config=RetryConfig(),
+            logging_config=LoggingConfig(),
+            logger=logger,
+        )
+
+        class ExplodingContext(dict[str, object]):
+            def get(self, *args: object) -> object:
+                raise AssertionError("context read while logging is disabled")
+
+        error = LLMParseError(message="bad", raw_response="x", parse_error=ValueError("x"))
+        error.context = ExplodingContext()
+
+        engine._log_validation_failure(error, 0)
+
+    def test_backoff_counts_correction_work(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test the backoff sleep only covers what remains after building the correction."""
+        sleeps: list[float] = []
+        engine = make_engine(
+            RetryConfig(max_retries=1, initial_delay_seconds=5.0), sleep=sleeps.append
+        )
+        client = FakeChatClient(json.dumps({"name": "test", "value": 42}))
+
+        engine.validate_with_retries(
+            response_text='{"invalid": json}',
+            response_model=SampleModel,
+            client=client,
+            prompt_system="sys",
+            prompt_user="usr",
+        )
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] < 5.0
+
+    @pytest.mark.asyncio
+    async def test_async_backoff_uses_injected_sleep(
+        self,
+        make_engine: Callable[..., ValidationEngine],
+    ) -> None:
+        """Test async retries wait through the injected async sleep."""
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        engine = make_engine(
+            RetryConfig(max_retries=1, initial_delay_seconds=5.0), async_sleep=fake_sleep
+        )
+        client = FakeChatClient(json.dumps({"name": "test", "value": 42}))
+
+        result = await engine.validate_with_retries_async(
+            response_text='{"invalid": json}',
+            response_model=SampleModel,
+            client=client,
+            prompt_system="sys",
+            prompt_user="usr",
+        )
+
+        assert result.name == "test"
+        assert len(sleeps) == 1 and 0 < sleeps[0] < 5.0
+
+
+def test_type_adapter_cached_per_model() -> None:
+    """Test the response model's TypeAdapter is built once and reused."""
+    from pydantic_llm_io.validation.engine import _get_adapter
+
+    assert _get_adapter(SampleModel) is _get_adapter(SampleModel)
+
+
+def test_default_logger() -> None:
+    """Test engines created without a logger share the module logger."""
+    first = ValidationEngine(retry_config=RetryConfig(), logging_config=LoggingConfig())
+    second = ValidationEngine(retry_config=RetryConfig(), logging_config=LoggingConfig())
+
+    assert first.logger is second.logger
+    assert first.logger.name == "pydantic_llm_io.validation.engine"